@@ -1,17 +1,177 @@
 # Day 03 - Dataset Class
 # Author: Rakshith
 
+import numpy as np
+
+
 class Dataset:
-    def __init__(self, data):
-        self.data = data
-        
+    # Samples live in one typed NumPy buffer plus a validity bitmask (one
+    # bit per sample, 1 = present), instead of a list of boxed Python
+    # objects. Missing slots hold 0 in the buffer.
+    #
+    # The buffer can also be a read-only memory map of a file on disk
+    # (Dataset.from_file), so several processes share one copy through the
+    # page cache. Slicing such a dataset, removing its missing samples and
+    # iterating over it in batches never loads the whole file: slices are
+    # views, and remove_missing() keeps an index of the valid samples
+    # instead of compacting the buffer.
+    __slots__ = ("_values", "_valid_bits", "_missing", "_index")
+
+    def __init__(self, data, dtype=None, valid=None):
+        if valid is None:
+            if isinstance(data, np.ndarray):
+                valid = np.ones(len(data), dtype=bool)
+            else:
+                valid = np.fromiter((v is not None for v in data), dtype=bool, count=len(data))
+        valid = np.asarray(valid, dtype=bool)
+
+        if isinstance(data, np.ndarray):
+            values = data.astype(dtype, copy=False) if dtype is not None else data
+        else:
+            present = np.asarray([v for v in data if v is not None], dtype=dtype)
+            values = np.zeros(len(valid), dtype=present.dtype)
+            values[valid] = present
+
+        self._values = values
+        self._valid_bits = np.packbits(valid, bitorder="little")
+        self._missing = int(len(valid) - np.count_nonzero(valid))
+        self._index = None
+
+    @classmethod
+    def _from_parts(cls, values, valid_bits, missing, index=None):
+        dataset = cls.__new__(cls)
+        dataset._values = values
+        dataset._valid_bits = valid_bits
+        dataset._missing = missing
+        dataset._index = index
+        return dataset
+
+    @classmethod
+    def from_file(cls, path, dtype=np.float64, valid_path=None):
+        # `path` is a .npy file or a raw binary file of `dtype` samples;
+        # `valid_path` an optional packed validity bitmask as written by
+        # save(). Both are memory-mapped read-only.
+        if str(path).endswith(".npy"):
+            values = np.load(path, mmap_mode="r")
+        else:
+            values = np.memmap(path, dtype=dtype, mode="r")
+
+        if valid_path is None:
+            valid_bits = np.packbits(np.ones(len(values), dtype=bool), bitorder="little")
+            return cls._from_parts(values, valid_bits, 0)
+
+        valid_bits = np.memmap(valid_path, dtype=np.uint8, mode="r")
+        present = 0
+        step = 1 << 20
+        for start in range(0, len(values), step * 8):
+            stop = min(start + step * 8, len(values))
+            bits = valid_bits[start // 8:(stop + 7) // 8]
+            present += int(np.unpackbits(bits, count=stop - start, bitorder="little").sum())
+        return cls._from_parts(values, valid_bits, len(values) - present)
+
+    def save(self, path, valid_path=None):
+        # Raw samples to `path`, packed validity bits to `valid_path`
+        # (default: `path` + ".valid"); reopen with from_file().
+        self.values.tofile(path)
+        valid = np.ones(len(self), dtype=bool) if self._index is not None else self.valid
+        np.packbits(valid, bitorder="little").tofile(valid_path or f"{path}.valid")
+
+    def __len__(self):
+        if self._index is not None:
+            return len(self._index)
+        return len(self._values)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            if self._index is not None:
+                return Dataset._from_parts(self._values, self._valid_bits, 0, self._index[key])
+
+            start, stop, step = key.indices(len(self._values))
+            if step != 1:
+                raise ValueError("Dataset slices must be contiguous")
+            stop = max(start, stop)
+            # The values are a view; only the slice's validity bits are
+            # repacked (1/8 byte per sample).
+            valid = self._valid_range(start, stop)
+            return Dataset._from_parts(
+                self._values[start:stop],
+                np.packbits(valid, bitorder="little"),
+                int(len(valid) - np.count_nonzero(valid)),
+            )
+
+        i = range(len(self))[key]
+        if self._index is not None:
+            return self._values[self._index[i]].item()
+        return self._values[i].item() if self._valid_range(i, i + 1)[0] else None
+
+    @property
+    def values(self):
+        if self._index is not None:
+            return self._values[self._index]
+        return self._values
+
+    @property
+    def valid(self):
+        if self._index is not None:
+            return np.ones(len(self._index), dtype=bool)
+        return self._valid_range(0, len(self._values))
+
+    @property
+    def missing_count(self):
+        return self._missing
+
+    @property
+    def data(self):
+        # List view with None for missing samples, as the original API had.
+        return self._to_list(len(self))
+
+    def _valid_range(self, start, stop):
+        bits = self._valid_bits[start // 8:(stop + 7) // 8]
+        offset = start % 8
+        return np.unpackbits(bits, count=offset + stop - start, bitorder="little")[offset:].view(bool)
+
+    def _to_list(self, stop):
+        stop = min(stop, len(self))
+        if self._index is not None:
+            return self._values[self._index[:stop]].tolist()
+        values = self._values[:stop].tolist()
+        if self._missing == 0:
+            return values
+        return [v if ok else None for v, ok in zip(values, self._valid_range(0, stop))]
+
     def summary(self):
-        print(f"Total samples: {len(self.data)}")
-        print(f"First 5 samples: {self.data[:5]}")
-        
-    def remove_missing(self):
-        clean_data = []
-        for value in self.data:
-            if value is not None:
-                clean_data.append(value)
-        self.data = clean_data
\ No newline at end of file
+        print(f"Total samples: {len(self)}")
+        print(f"Missing samples: {self.missing_count}")
+        print(f"First 5 samples: {self._to_list(5)}")
+
+    def remove_missing(self, lazy=None):
+        # lazy=None picks the index view for memory-mapped data and an
+        # in-place compaction for in-memory data.
+        if not self._missing:
+            return
+        if lazy is None:
+            lazy = isinstance(self._values, np.memmap)
+
+        if lazy:
+            index_dtype = np.int32 if len(self._values) < 2 ** 31 else np.int64
+            step = 1 << 23
+            self._index = np.concatenate([
+                np.flatnonzero(self._valid_range(start, min(start + step, len(self._values))))
+                .astype(index_dtype) + index_dtype(start)
+                for start in range(0, len(self._values), step)
+            ])
+        else:
+            self._values = self._values[self.valid]
+            self._valid_bits = np.packbits(np.ones(len(self._values), dtype=bool), bitorder="little")
+        self._missing = 0
+
+    def iter_batches(self, batch_size):
+        # Yields arrays of up to `batch_size` samples: views of the buffer,
+        # or gathers through the index after a lazy remove_missing(). Missing
+        # samples (if not removed) appear as 0.
+        for start in range(0, len(self), batch_size):
+            stop = start + batch_size
+            if self._index is not None:
+                yield self._values[self._index[start:stop]]
+            else:
+                yield self._values[start:stop]
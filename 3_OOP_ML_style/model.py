@@ -1,15 +1,113 @@
 # Day 03 - Model Class
 # Author: Rakshith
 
+import numpy as np
+
+
 class SimpleModel:
-    def __init__(self):
+    # Linear model y = Xw + b (the np.dot(X, w) from 4_numpy_for_ml, plus a
+    # bias) trained with NumPy only.
+    #
+    #   method="closed_form": solves the (ridge) normal equations. X^T X and
+    #       X^T y are accumulated over row blocks, so X can be a memmap.
+    #   method="gd": mini-batch gradient descent on the squared error.
+    #
+    # dtype=np.float32 halves memory traffic in training and prediction;
+    # predict() works through X in blocks of `batch_size` rows and writes
+    # into one preallocated output array.
+
+    def __init__(self, method="closed_form", dtype=np.float64, l2=0.0,
+                 learning_rate=0.01, epochs=20, batch_size=65_536, random_state=0):
+        if method not in ("closed_form", "gd"):
+            raise ValueError(f"Unknown training method: {method}")
+        self.method = method
+        self.dtype = np.dtype(dtype)
+        self.l2 = l2
+        self.learning_rate = learning_rate
+        self.epochs = epochs
+        self.batch_size = batch_size
+        self.random_state = random_state
+        self.weights = None
+        self.bias = 0.0
         self.is_trained = False
 
-    def train(self, data):
+    def _as_2d(self, X):
+        X = np.asarray(X)
+        return X.reshape(-1, 1) if X.ndim == 1 else X
+
+    def _block(self, X, start, stop):
+        return np.ascontiguousarray(X[start:stop], dtype=self.dtype)
+
+    def train(self, X, y):
         print("Training model on data...")
+        X = self._as_2d(X)
+        y = np.asarray(y)
+        if len(X) != len(y):
+            raise ValueError(f"X has {len(X)} samples but y has {len(y)}")
+
+        if self.method == "closed_form":
+            self._train_closed_form(X, y)
+        else:
+            self._train_gd(X, y)
         self.is_trained = True
 
-    def predict(self, X):
+    def _train_closed_form(self, X, y):
+        # Normal equations for [X, 1]: the Gram matrix and right-hand side
+        # are summed block by block in float64 for a stable solve.
+        n_features = X.shape[1]
+        gram = np.zeros((n_features + 1, n_features + 1))
+        rhs = np.zeros(n_features + 1)
+        for start in range(0, len(X), self.batch_size):
+            stop = start + self.batch_size
+            Xb = self._block(X, start, stop)
+            yb = np.asarray(y[start:stop], dtype=self.dtype)
+            gram[:n_features, :n_features] += Xb.T @ Xb
+            col_sums = Xb.sum(axis=0)
+            gram[:n_features, n_features] += col_sums
+            gram[n_features, :n_features] += col_sums
+            gram[n_features, n_features] += len(Xb)
+            rhs[:n_features] += Xb.T @ yb
+            rhs[n_features] += yb.sum()
+
+        gram[:n_features, :n_features] += self.l2 * np.eye(n_features)
+        try:
+            solution = np.linalg.solve(gram, rhs)
+        except np.linalg.LinAlgError:
+            solution = np.linalg.lstsq(gram, rhs, rcond=None)[0]
+
+        self.weights = solution[:n_features].astype(self.dtype)
+        self.bias = self.dtype.type(solution[n_features])
+
+    def _train_gd(self, X, y):
+        rng = np.random.default_rng(self.random_state)
+        n_samples, n_features = X.shape
+        self.weights = np.zeros(n_features, dtype=self.dtype)
+        self.bias = self.dtype.type(0)
+        lr = self.dtype.type(self.learning_rate)
+        l2 = self.dtype.type(self.l2)
+
+        for _ in range(self.epochs):
+            # Shuffle whole batches rather than rows, so each batch is still
+            # a contiguous (memmap-friendly) slice of X.
+            starts = rng.permutation(np.arange(0, n_samples, self.batch_size))
+            for start in starts:
+                stop = start + self.batch_size
+                Xb = self._block(X, start, stop)
+                yb = np.asarray(y[start:stop], dtype=self.dtype)
+                error = Xb @ self.weights + self.bias - yb
+                grad_w = Xb.T @ error / len(Xb) + l2 * self.weights
+                self.weights -= lr * grad_w
+                self.bias -= lr * error.mean()
+
+    def predict(self, X, out=None):
         if not self.is_trained:
             raise Exception("Model is not trained yet!")
-        return [1 for _ in X]
+        X = self._as_2d(X)
+        if out is None:
+            out = np.empty(len(X), dtype=self.dtype)
+
+        for start in range(0, len(X), self.batch_size):
+            stop = min(start + self.batch_size, len(X))
+            np.dot(self._block(X, start, stop), self.weights, out=out[start:stop])
+            out[start:stop] += self.bias
+        return out
@@ -12,8 +12,16 @@ dataset.summary()
 dataset.remove_missing()
 print("After cleaning:", dataset.data)
 
+# Target to learn: y = 2x + 1
+targets = 2 * dataset.values + 1
+
 model = SimpleModel()
-model.train(dataset.data)
+model.train(dataset.values, targets)
+print("Learned weights:", model.weights, "bias:", model.bias)
 
-predictions = model.predict(dataset.data)
+# Stream the samples through the model in batches; with a memory-mapped
+# dataset (Dataset.from_file) only one batch is in memory at a time.
+predictions = []
+for batch in dataset.iter_batches(batch_size=4):
+    predictions.extend(model.predict(batch).round(2).tolist())
 print("Predictions:", predictions)
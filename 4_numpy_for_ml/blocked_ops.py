@@ -0,0 +1,99 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+# Multithreaded, blocked evaluation of elementwise NumPy operations.
+#
+# NumPy releases the GIL inside ufunc loops, so splitting a large array into
+# cache-sized blocks and running the ufunc on each block from a thread pool
+# uses every core. Results go into a preallocated `out` array (which may be
+# one of the inputs, for in-place updates), so no full-size temporary is
+# created.
+#
+#   with BlockedExecutor() as ex:
+#       ex.apply(np.square, arr, out=arr)                      # in place
+#       y = ex.apply(np.add, a, b)                             # new output
+#       ex.map(lambda x, out: np.multiply(x, 3.0, out=out), a, out=y)
+
+
+class BlockedExecutor:
+    def __init__(self, n_threads=None, block_bytes=256 * 1024, min_blocks=4):
+        self.n_threads = n_threads or os.cpu_count() or 1
+        self.block_bytes = block_bytes
+        self.min_blocks = min_blocks
+        self._pool = ThreadPoolExecutor(max_workers=self.n_threads)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+
+    def shutdown(self):
+        self._pool.shutdown(wait=True)
+
+    def apply(self, ufunc, *inputs, out=None, **kwargs):
+        """
+        Computes ufunc(*inputs, out=out, **kwargs) block by block.
+
+        Inputs are same-shape arrays or scalars. `out` defaults to a new
+        array of the ufunc's result dtype.
+        """
+        return self.map(lambda *blocks, out: ufunc(*blocks, out=out, **kwargs), *inputs, out=out,
+                        probe=lambda *xs: ufunc(*xs, **kwargs))
+
+    def map(self, func, *inputs, out=None, probe=None):
+        """
+        Calls func(*input_blocks, out=out_block) for every block.
+
+        `func` must be elementwise and write its result into `out`. When
+        `out` is None, `probe` (or func on a one-element slice) is used to
+        find the output dtype.
+        """
+        arrays = [x for x in inputs if isinstance(x, np.ndarray)]
+        if not arrays:
+            raise ValueError("map() needs at least one array input")
+        shape = arrays[0].shape
+        if any(a.shape != shape for a in arrays):
+            raise ValueError("all array inputs must have the same shape")
+
+        if out is None:
+            heads = [x.reshape(-1)[:1] if isinstance(x, np.ndarray) else x for x in inputs]
+            if probe is not None:
+                dtype = np.asarray(probe(*heads)).dtype
+            else:
+                dtype = np.result_type(*arrays)
+            out = np.empty(shape, dtype=dtype)
+
+        flat_inputs = [_flat_view(x) for x in inputs]
+        flat_out = _flat_view(out)
+        if any(x is None for x in flat_inputs) or flat_out is None:
+            # Non-contiguous data cannot be split into flat blocks cheaply;
+            # fall back to a single call.
+            func(*inputs, out=out)
+            return out
+
+        itemsize = max(a.itemsize for a in arrays + [out])
+        block = max(1024, self.block_bytes // itemsize)
+        size = flat_out.size
+        if self.n_threads == 1 or size < block * self.min_blocks:
+            func(*flat_inputs, out=flat_out)
+            return out
+
+        def run(start):
+            stop = start + block
+            func(*[x[start:stop] if isinstance(x, np.ndarray) else x for x in flat_inputs],
+                 out=flat_out[start:stop])
+
+        # list() re-raises the first exception from any block.
+        list(self._pool.map(run, range(0, size, block)))
+        return out
+
+
+def _flat_view(x):
+    if not isinstance(x, np.ndarray):
+        return x
+    if not x.flags.c_contiguous:
+        return None
+    return x.reshape(-1)
@@ -1,16 +1,100 @@
 import numpy as np
 
-# Feature matrix (X)
-X = np.array([
-    [1, 2],
-    [2, 3],
-    [3, 4],
-    [4, 5]
-])
-
-# Weights
-w = np.array([0.5, 1.0])
-
-# Linear model: y = Xw
-y_pred = np.dot(X, w)
-print("Predictions:", y_pred)
+
+def predict_batched(X, w, out=None, batch_rows=65_536, dtype=np.float64):
+    """
+    Linear model predictions y = Xw, computed one block of rows at a time.
+
+    X can be a dense array or np.memmap (only `batch_rows` rows are read
+    and cast at once), or a CSR sparse matrix - anything with `data`,
+    `indices`, `indptr` and `shape`, such as scipy.sparse.csr_matrix or the
+    same three arrays memory-mapped from disk. Sparse rows are multiplied
+    using only their stored values, never densified.
+
+    `dtype` is the accumulation type (np.float32 halves memory traffic);
+    results are written into `out` if given, else into a new array.
+    """
+    # scipy.sparse matrices carry a `format`; only CSR is row-sliceable
+    # (CSC has the same three arrays but indexes columns, not rows).
+    if getattr(X, "format", "csr") != "csr":
+        raise TypeError(f"sparse input must be CSR, got {X.format!r}; convert with X.tocsr()")
+    sparse = hasattr(X, "indptr")
+    if not sparse and not hasattr(X, "__array__"):
+        raise TypeError(f"X must be a dense array or CSR matrix, got {type(X).__name__}")
+
+    dtype = np.dtype(dtype)
+    w = np.asarray(w, dtype=dtype)
+    n_rows = X.shape[0]
+    if out is None:
+        out = np.empty(n_rows, dtype=dtype)
+
+    for start in range(0, n_rows, batch_rows):
+        stop = min(start + batch_rows, n_rows)
+        if sparse:
+            block = _csr_block_dot(X, w, start, stop, dtype)
+        else:
+            Xb = np.ascontiguousarray(X[start:stop], dtype=dtype)
+            if out.dtype == dtype and out[start:stop].flags.c_contiguous:
+                np.dot(Xb, w, out=out[start:stop])
+                continue
+            block = Xb @ w
+        out[start:stop] = block
+    return out
+
+
+def _csr_block_dot(X, w, start, stop, dtype):
+    indptr = np.asarray(X.indptr[start:stop + 1])
+    lo, hi = indptr[0], indptr[-1]
+    result = np.zeros(stop - start, dtype=dtype)
+    if hi == lo:
+        return result
+
+    # One trailing zero so every row offset, including those of empty rows
+    # at the end of the block, is a valid reduceat index.
+    products = np.zeros(hi - lo + 1, dtype=dtype)
+    np.multiply(np.asarray(X.data[lo:hi], dtype=dtype), w[X.indices[lo:hi]], out=products[:-1])
+
+    # Sum each row's products; reduceat is wrong for empty rows, so those
+    # are left at zero.
+    nonempty = indptr[1:] > indptr[:-1]
+    sums = np.add.reduceat(products, indptr[:-1] - lo)
+    result[nonempty] = sums[nonempty]
+    return result
+
+
+if __name__ == "__main__":
+    # Feature matrix (X)
+    X = np.array([
+        [1, 2],
+        [2, 3],
+        [3, 4],
+        [4, 5]
+    ])
+
+    # Weights
+    w = np.array([0.5, 1.0])
+
+    # Linear model: y = Xw
+    y_pred = np.dot(X, w)
+    print("Predictions:", y_pred)
+
+    # Same predictions, two rows at a time, accumulated in float32
+    print("Batched (float32):", predict_batched(X, w, batch_rows=2, dtype=np.float32))
+
+    # Sparse input in CSR form: only non-zero entries are stored and used
+    X_sparse = np.array([
+        [0, 2],
+        [0, 0],
+        [3, 0],
+        [4, 5]
+    ])
+    rows, cols = np.nonzero(X_sparse)
+
+    class CSR:
+        data = X_sparse[rows, cols]
+        indices = cols
+        indptr = np.concatenate([[0], np.cumsum(np.bincount(rows, minlength=4))])
+        shape = X_sparse.shape
+
+    print("Sparse predictions:", predict_batched(CSR, w, batch_rows=3))
+    print("Dense check:       ", np.dot(X_sparse, w))
@@ -1,20 +1,144 @@
-import numpy as np
+import argparse
+import json
+import os
+import statistics
 import time
+import tracemalloc
+
+import numpy as np
+
+from blocked_ops import BlockedExecutor
+
+# Squaring an array four ways - Python loop, NumPy, NumPy writing into a
+# preallocated buffer (out=), and NumPy on several threads over blocks -
+# timed properly: warmup runs, many repeats with perf_counter_ns, summary
+# statistics, peak memory, and sweeps over array size and dtype.
+#
+#   python vectorization_vs_loop.py
+#   python vectorization_vs_loop.py --sizes 1e4 1e6 1e8 --dtypes int64 float32 --json results.json
+
+
+def square_loop(data):
+    squared = []
+    for n in data["list"]:
+        squared.append(n ** 2)
+    return squared
+
+
+def square_numpy(data):
+    return data["array"] ** 2
+
+
+def square_numpy_out(data):
+    return np.square(data["array"], out=data["out"])
+
+
+_EXECUTOR = BlockedExecutor()
+
+
+def square_threaded(data):
+    # Cache-sized blocks on a thread pool; see blocked_ops.py.
+    return _EXECUTOR.apply(np.square, data["array"], out=data["out"])
+
+
+VARIANTS = {
+    "loop": square_loop,
+    "numpy": square_numpy,
+    "numpy_out": square_numpy_out,
+    "threaded_blocked": square_threaded,
+}
+
+
+def make_inputs(size, dtype, with_list):
+    array = np.arange(size, dtype=dtype) % 1000
+    return {
+        "array": array,
+        "out": np.empty_like(array),
+        "list": array.tolist() if with_list else None,
+    }
+
+
+def benchmark(func, data, repeats=7, warmup=2):
+    """
+    Times func(data) `repeats` times after `warmup` untimed calls.
+
+    Returns summary statistics in nanoseconds plus the peak memory
+    (tracemalloc) allocated by one extra, untimed call.
+    """
+    for _ in range(warmup):
+        func(data)
+
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter_ns()
+        func(data)
+        times.append(time.perf_counter_ns() - start)
+
+    tracemalloc.start()
+    func(data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "repeats": repeats,
+        "min_ns": min(times),
+        "median_ns": statistics.median(times),
+        "mean_ns": statistics.fmean(times),
+        "stdev_ns": statistics.stdev(times) if len(times) > 1 else 0.0,
+        "max_ns": max(times),
+        "peak_bytes": peak,
+    }
+
+
+def sweep(sizes, dtypes, variants=VARIANTS, repeats=7, warmup=2, max_loop_size=1_000_000):
+    results = []
+    for dtype in dtypes:
+        for size in sizes:
+            data = make_inputs(size, dtype, with_list=size <= max_loop_size)
+            expected = data["array"] ** 2
+            for name, func in variants.items():
+                if name == "loop" and data["list"] is None:
+                    continue  # minutes per run at this size; not informative
+                stats = benchmark(func, data, repeats=repeats, warmup=warmup)
+                stats.update({
+                    "variant": name,
+                    "dtype": np.dtype(dtype).name,
+                    "size": size,
+                    "ns_per_element": stats["median_ns"] / size,
+                    "matches_numpy": bool(np.array_equal(np.asarray(func(data), dtype=expected.dtype), expected)),
+                })
+                results.append(stats)
+    return results
+
+
+def print_table(results):
+    print(f"{'dtype':<8} {'size':>12} {'variant':<17} {'median':>12} {'stdev':>10} "
+          f"{'ns/elem':>9} {'peak MiB':>9}")
+    for r in results:
+        print(f"{r['dtype']:<8} {r['size']:>12,} {r['variant']:<17} "
+              f"{r['median_ns'] / 1e6:>9.3f} ms {r['stdev_ns'] / 1e6:>7.3f} ms "
+              f"{r['ns_per_element']:>9.3f} {r['peak_bytes'] / 2**20:>9.2f}")
 
-# Using loop
-numbers = list(range(1_000_000))
 
-start = time.time()
-squared_loop = []
-for n in numbers:
-    squared_loop.append(n ** 2)
-print("Loop time:", time.time() - start)
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Loop vs NumPy vectorization benchmark")
+    parser.add_argument("--sizes", type=float, nargs="+", default=[1e3, 1e5, 1e6])
+    parser.add_argument("--dtypes", nargs="+", default=["int64", "float64", "float32"])
+    parser.add_argument("--repeats", type=int, default=7)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--max-loop-size", type=float, default=1e6)
+    parser.add_argument("--json", help="write results to this file as JSON")
+    args = parser.parse_args()
 
-# Using NumPy
-arr = np.array(numbers)
+    results = sweep(
+        [int(s) for s in args.sizes],
+        args.dtypes,
+        repeats=args.repeats,
+        warmup=args.warmup,
+        max_loop_size=int(args.max_loop_size),
+    )
+    print_table(results)
 
-start = time.time()
-squared_np = arr ** 2
-print("NumPy time:", time.time() - start)
-print("First 5 squared values (loop):", squared_loop[:5])
-print("First 5 squared values (NumPy):", squared_np[:5])
\ No newline at end of file
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"numpy": np.__version__, "cpus": os.cpu_count(), "results": results}, f, indent=2)
@@ -0,0 +1,158 @@
+"""
+Declarative derived columns
+Author: Rakshith
+
+Conditional columns are usually written as row-by-row Python:
+
+    df['level'] = df['score'].apply(categorize_performance)
+    df['age_group'] = df['age'].apply(lambda x: '20-25' if x <= 25 else ...)
+    df['summary'] = df.apply(create_summary, axis=1)
+
+Each of those calls a Python function once per row. The same columns can be
+described as rules and computed with whole-column NumPy operations:
+
+    Conditions([...])  ordered (condition, label) pairs -> np.select
+    Bins(...)          value ranges -> labels           -> np.searchsorted
+    Template(...)      "{name} ({department})" strings  -> array concatenation
+
+    rules = ColumnRules({
+        "performance_level": Conditions([("performance_score >= 90", "Excellent"),
+                                         ("performance_score >= 85", "Good")],
+                                        default="Average"),
+        "age_group": Bins("age", edges=[25, 30], labels=["20-25", "26-30", "31+"]),
+        "summary": Template("{name} ({department}) - ${salary:,}"),
+    })
+    df = rules.apply(df)
+
+Conditions and Bins return categoricals (small int codes + one copy of each
+label); Template returns strings.
+"""
+
+import string
+
+import numpy as np
+import pandas as pd
+
+
+class Conditions:
+    """
+    Ordered rules: the first condition that holds picks the label, like an
+    if/elif chain; rows matching none get `default`.
+
+    A condition is a DataFrame.eval() expression ("salary >= 50000"), a
+    function of the frame returning a boolean mask, or the mask itself.
+    """
+
+    def __init__(self, rules, default=None):
+        self.rules = list(rules)
+        self.default = default
+        labels = [label for _, label in self.rules]
+        if default is not None:
+            labels.append(default)
+        self.categories = list(dict.fromkeys(labels))
+
+    def evaluate(self, df):
+        codes = {label: i for i, label in enumerate(self.categories)}
+        masks = [_mask(df, condition) for condition, _ in self.rules]
+        choices = [codes[label] for _, label in self.rules]
+        default = codes[self.default] if self.default is not None else -1
+        selected = np.select(masks, choices, default=default).astype(np.int32)
+        return pd.Categorical.from_codes(selected, categories=self.categories)
+
+
+class Bins:
+    """
+    Labels value ranges of one column. `edges` are the sorted boundaries
+    between consecutive labels, so len(labels) == len(edges) + 1. With
+    right=True a value equal to an edge falls in the lower bin (x <= 25 ->
+    "20-25"); with right=False in the upper one. Missing values stay missing.
+    """
+
+    def __init__(self, column, edges, labels, right=True):
+        if len(labels) != len(edges) + 1:
+            raise ValueError(f"{len(edges)} edges need {len(edges) + 1} labels, got {len(labels)}")
+        edges = np.asarray(edges, dtype=np.float64)
+        if np.any(np.diff(edges) <= 0):
+            raise ValueError("bin edges must be strictly increasing")
+        self.column = column
+        self.edges = edges
+        self.labels = list(labels)
+        self.right = right
+
+    def evaluate(self, df):
+        values = df[self.column].to_numpy(dtype=np.float64, na_value=np.nan)
+        codes = np.searchsorted(self.edges, values, side="left" if self.right else "right")
+        codes = codes.astype(np.int32)
+        codes[np.isnan(values)] = -1
+        return pd.Categorical.from_codes(codes, categories=self.labels, ordered=True)
+
+
+class Template:
+    """
+    Builds strings from str.format-style templates, one column at a time:
+    each distinct value of a field is formatted once and the pieces are
+    joined as whole arrays.
+    """
+
+    def __init__(self, template):
+        self.template = template
+        self.parts = []
+        for literal, field, spec, conversion in string.Formatter().parse(template):
+            if literal:
+                self.parts.append(("literal", literal, None, None))
+            if field is not None:
+                if not field:
+                    raise ValueError("Template fields must name a column")
+                self.parts.append(("field", field, spec or "", conversion))
+
+    def evaluate(self, df):
+        result = np.full(len(df), "", dtype=object)
+        for kind, value, spec, conversion in self.parts:
+            if kind == "literal":
+                result += value
+                continue
+            codes, uniques = pd.factorize(df[value], use_na_sentinel=False)
+            formatted = np.array([_format(v, spec, conversion) for v in uniques], dtype=object)
+            result += formatted[codes]
+        return pd.Series(result, index=df.index, dtype="str")
+
+
+class ColumnRules:
+    """
+    A set of derived columns: {name: Conditions | Bins | Template}.
+    Rules are evaluated in order, so later rules may use earlier outputs.
+    """
+
+    def __init__(self, rules):
+        self.rules = dict(rules)
+
+    def evaluate(self, df):
+        outputs = {}
+        for name, rule in self.rules.items():
+            frame = df.assign(**outputs) if outputs else df
+            outputs[name] = rule.evaluate(frame)
+        return outputs
+
+    def apply(self, df):
+        return df.assign(**self.evaluate(df))
+
+
+def _mask(df, condition):
+    if isinstance(condition, str):
+        mask = df.eval(condition)
+    elif callable(condition):
+        mask = condition(df)
+    else:
+        mask = condition
+    # Missing values never satisfy a condition.
+    return np.asarray(pd.Series(mask).fillna(False), dtype=bool)
+
+
+def _format(value, spec, conversion):
+    if conversion == "r":
+        value = repr(value)
+    elif conversion == "s":
+        value = str(value)
+    elif conversion == "a":
+        value = ascii(value)
+    return format(value, spec)
@@ -12,6 +12,9 @@ This script demonstrates:
 import pandas as pd
 import numpy as np
 
+from group_imputer import GroupImputer
+from streaming_fill import StreamingFiller
+
 print("=" * 60)
 print("LESSON 1: Detecting Missing Values")
 print("=" * 60)
@@ -82,7 +85,7 @@ df_filled["performance_score"] = df_filled["performance_score"].fillna(0)
 
 # Strategy 5: Forward fill (use previous value)
 print("\n Strategy 5: Fill 'name' with forward fill")
-df_filled["name"] = df_filled["name"].fillna(method='ffill')
+df_filled["name"] = df_filled["name"].ffill()
 
 print("\ DataFrame after filling missing values:")
 print(df_filled)
@@ -135,12 +138,24 @@ df_temp["temperature_interpolated"] = df_temp["temperature"].interpolate()
 print("\n After linear interpolation:")
 print(df_temp)
 
+# Feeds that arrive in pieces: StreamingFiller carries the last reading (and
+# any gap still waiting for its next reading) from one chunk to the next,
+# so the result is the same as interpolating the whole series at once.
+print("\n Same interpolation, two rows at a time:")
+filler = StreamingFiller("temperature", method="linear")
+chunks = [df_temp.iloc[i:i + 2] for i in range(0, len(df_temp), 2)]
+df_streamed = pd.concat(filler.transform(chunks))
+print(df_streamed[["day", "temperature"]])
+
 # Fill with group-specific values (e.g., department average)
 print("\n Fill salary based on department average:")
 df_grouped = df.copy()
-df_grouped["salary"] = df_grouped.groupby("department")["salary"].transform(
-    lambda x: x.fillna(x.mean())
-)
+# groupby().transform(lambda x: x.fillna(x.mean())) calls the lambda once
+# per group; GroupImputer learns every group mean in one aggregation and
+# fills by key lookup. Groups with no known salary (IT here) and rows with
+# no department get the overall mean instead of staying empty.
+imputer = GroupImputer(by="department", column="salary", strategy="mean")
+df_grouped["salary"] = imputer.fit_transform(df_grouped)
 print(df_grouped[["name", "department", "salary"]])
 
 print("\n" + "=" * 60)
@@ -182,8 +197,8 @@ print("""
 1. Use .isnull() and .isnull().sum() to detect missing values
 2. Use .fillna() to fill missing values with mean, median, mode, or custom values
 3. Use .dropna() to remove rows or columns with missing data
-4. Use .interpolate() for sequential/time series data
-5. Use .groupby().transform() for group-specific filling
+4. Use .interpolate() for sequential/time series data (StreamingFiller for chunked feeds)
+5. Use GroupImputer (or .groupby().transform()) for group-specific filling
 6. Always consider the context before choosing a strategy
 """)
 
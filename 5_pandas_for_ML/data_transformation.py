@@ -13,6 +13,8 @@ This script demonstrates:
 import pandas as pd
 import numpy as np
 
+from column_rules import Bins, ColumnRules, Conditions, Template
+
 print("=" * 60)
 print("LESSON 1: Filtering Data")
 print("=" * 60)
@@ -100,28 +102,31 @@ print("\n Create 'annual_bonus' column (10% of salary):")
 df['annual_bonus'] = df['salary'] * 0.10
 print(df[['name', 'salary', 'annual_bonus']].head())
 
-# Conditional column using np.where()
+# Conditional columns as rules instead of np.where chains, .apply() with an
+# if/elif function, or a nested-ternary lambda. Each rule runs on whole
+# columns (np.select / np.searchsorted) and returns a categorical.
+category_rules = ColumnRules({
+    # Ordered conditions: the first one that holds wins, like if/elif
+    "salary_category": Conditions([
+        ("salary < 40000", "Low"),
+        ("salary >= 50000", "High"),
+    ], default="Medium"),
+    "performance_level": Conditions([
+        ("performance_score >= 90", "Excellent"),
+        ("performance_score >= 85", "Good"),
+    ], default="Average"),
+    # Ranges: age <= 25, 25 < age <= 30, age > 30
+    "age_group": Bins("age", edges=[25, 30], labels=["20-25", "26-30", "31+"]),
+})
+df = category_rules.apply(df)
+
 print("\n Create 'salary_category' based on salary amount:")
-df['salary_category'] = np.where(df['salary'] >= 50000, 'High', 'Medium')
-df['salary_category'] = np.where(df['salary'] < 40000, 'Low', df['salary_category'])
 print(df[['name', 'salary', 'salary_category']].head(8))
 
-# Using .apply() with a custom function
-print("\n Create 'performance_level' using apply():")
-def categorize_performance(score):
-    if score >= 90:
-        return 'Excellent'
-    elif score >= 85:
-        return 'Good'
-    else:
-        return 'Average'
-
-df['performance_level'] = df['performance_score'].apply(categorize_performance)
+print("\n Create 'performance_level' from ordered score conditions:")
 print(df[['name', 'performance_score', 'performance_level']].head(8))
 
-# Using lambda function
-print("\n Create 'age_group' using lambda:")
-df['age_group'] = df['age'].apply(lambda x: '20-25' if x <= 25 else ('26-30' if x <= 30 else '31+'))
+print("\n Create 'age_group' from age ranges:")
 print(df[['name', 'age', 'age_group']].head(8))
 
 # Combining multiple columns
@@ -143,12 +148,12 @@ print("\n Convert names to uppercase:")
 df['name_upper'] = df['name'].str.upper()
 print(df[['name', 'name_upper']].head())
 
-# Apply function row-wise (axis=1)
+# Combine several fields into one string. df.apply(..., axis=1) would call a
+# Python function per row; a Template formats each distinct value once and
+# joins whole columns.
 print("\n Create 'summary' column combining multiple fields:")
-def create_summary(row):
-    return f"{row['name']} ({row['department']}) - ${row['salary']:,}"
-
-df['summary'] = df.apply(create_summary, axis=1)
+summary = Template("{name} ({department}) - ${salary:,}")
+df['summary'] = summary.evaluate(df)
 print(df['summary'].head())
 
 # Transform data within groups
@@ -230,7 +235,7 @@ print("""
 3. Use .query() for more readable complex filters
 4. Sort with .sort_values(), specify ascending=False for descending
 5. Create columns with simple assignment: df['new'] = calculation
-6. Use .apply() for complex transformations with custom functions
+6. Prefer column rules (np.select, bins, templates) over row-wise .apply()
 7. Use pd.merge() to join DataFrames on common columns
 8. Use pd.concat() to stack DataFrames vertically
 9. Use .transform() with .groupby() for group-wise calculations
@@ -0,0 +1,156 @@
+"""
+Group-wise imputation without per-group Python calls
+Author: Rakshith
+
+df.groupby("department")["salary"].transform(lambda x: x.fillna(x.mean()))
+calls the lambda once per group, which crawls when there are millions of
+groups. GroupImputer learns the per-group statistic with one vectorized
+aggregation and fills missing values through an integer key-code lookup:
+
+    imputer = GroupImputer(by="department", column="salary", strategy="median")
+    imputer.fit(df)                      # or fit(chunks) / partial_fit(chunk)
+    df["salary"] = imputer.transform(df)
+
+Statistics can be accumulated chunk by chunk. Rows whose group was never
+seen, or whose group had no values, get the global statistic instead.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+class GroupImputer:
+    STRATEGIES = ("mean", "median", "mode")
+
+    def __init__(self, by, column, strategy="mean", fallback="global"):
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"strategy must be one of {self.STRATEGIES}, got {strategy!r}")
+        self.by = by
+        self.column = column
+        self.strategy = strategy
+        self.fallback = fallback  # "global" or None (leave unseen groups missing)
+        self._sums = None
+        self._counts = None
+        self._table = None
+
+    # ---- fitting ----------------------------------------------------------
+
+    def partial_fit(self, chunk):
+        values = chunk[self.column]
+        keys = chunk[self.by]
+        present = values.notna() & keys.notna()
+
+        if self.strategy == "mean":
+            # Mergeable state: per-group sum and count.
+            stats = values[present].groupby(keys[present], sort=False).agg(["sum", "count"])
+            self._sums = _add(self._sums, stats["sum"])
+            self._counts = _add(self._counts, stats["count"])
+        else:
+            # Median and mode are exact from per-(group, value) counts.
+            pairs = pd.DataFrame({"key": keys[present], "value": values[present]})
+            counts = pairs.groupby(["key", "value"], sort=False).size()
+            self._counts = _add(self._counts, counts)
+
+        self._table = None
+        return self
+
+    def fit(self, data):
+        self._sums = self._counts = self._table = None
+        chunks = [data] if isinstance(data, pd.DataFrame) else data
+        for chunk in chunks:
+            self.partial_fit(chunk)
+        return self
+
+    @property
+    def statistics_(self):
+        # Per-group fill values (a Series indexed by group key).
+        if self._table is None:
+            self._table = self._compute()
+        return self._table[0]
+
+    @property
+    def global_statistic_(self):
+        if self._table is None:
+            self._table = self._compute()
+        return self._table[1]
+
+    def _compute(self):
+        if self._counts is None:
+            raise RuntimeError("GroupImputer must be fitted before use")
+
+        if self.strategy == "mean":
+            per_group = self._sums / self._counts
+            return per_group, self._sums.sum() / self._counts.sum()
+
+        counts = self._counts.rename("n").reset_index()
+        overall = counts.groupby("value", sort=False)["n"].sum().reset_index()
+        overall["key"] = 0
+        if self.strategy == "mode":
+            return _mode(counts), _mode(overall).iloc[0]
+        return _median(counts), _median(overall).iloc[0]
+
+    # ---- filling ----------------------------------------------------------
+
+    def transform(self, df):
+        values = df[self.column]
+        missing = values.isna().to_numpy()
+        if not missing.any():
+            return values.copy()
+
+        # Lookup table indexed by group code; code -1 (unseen or missing
+        # key) picks the last slot, which holds the fallback.
+        stats = self.statistics_
+        fallback = self.global_statistic_ if self.fallback == "global" else np.nan
+        codes = stats.index.get_indexer(df[self.by])
+
+        if self.strategy == "mode":
+            # Modes are values of the column itself (often text, e.g. a
+            # department), so the fill keeps the column's dtype.
+            table = np.append(stats.to_numpy(dtype=object), np.array([fallback], dtype=object))
+            result = values.to_numpy(dtype=object, copy=True)
+            result[missing] = table[codes[missing]]
+            return pd.Series(result, index=df.index, name=self.column, dtype=object).astype(values.dtype)
+
+        table = np.append(stats.to_numpy(dtype=np.float64), fallback)
+        table[:-1][np.isnan(table[:-1])] = fallback
+        result = values.to_numpy(dtype=np.float64, na_value=np.nan, copy=True)
+        result[missing] = table[codes[missing]]
+        return pd.Series(result, index=df.index, name=self.column)
+
+    def fit_transform(self, df):
+        return self.fit(df).transform(df)
+
+
+def _add(total, new):
+    if total is None:
+        return new.astype(np.float64)
+    return total.add(new, fill_value=0)
+
+
+def _mode(counts):
+    # Most frequent value per key; ties go to the smallest value, as with
+    # Series.mode()[0].
+    ordered = counts.sort_values(["key", "n", "value"], ascending=[True, False, True])
+    best = ordered.drop_duplicates("key")
+    return pd.Series(best["value"].to_numpy(), index=best["key"].to_numpy())
+
+
+def _median(counts):
+    # Weighted median per key from (key, value, n) rows: the values at
+    # 1-based ranks floor((t + 1) / 2) and ceil((t + 1) / 2) are averaged.
+    ordered = counts.sort_values(["key", "value"])
+    n = ordered["n"].to_numpy()
+    cum = ordered.groupby("key", sort=False)["n"].cumsum().to_numpy()
+    total = ordered.groupby("key", sort=False)["n"].transform("sum").to_numpy()
+    prev = cum - n
+
+    lo_rank = np.floor((total + 1) / 2)
+    hi_rank = np.ceil((total + 1) / 2)
+    is_lo = (prev < lo_rank) & (cum >= lo_rank)
+    is_hi = (prev < hi_rank) & (cum >= hi_rank)
+
+    keys = ordered["key"].to_numpy()
+    values = ordered["value"].to_numpy(dtype=np.float64)
+    lo = pd.Series(values[is_lo], index=keys[is_lo])
+    hi = pd.Series(values[is_hi], index=keys[is_hi])
+    return (lo + hi.reindex(lo.index)) / 2
@@ -0,0 +1,167 @@
+"""
+Gap filling for sequential data that arrives in chunks
+Author: Rakshith
+
+Series.interpolate() and Series.ffill() need the whole series in memory.
+StreamingFiller gives the same results chunk by chunk: it carries the last
+valid value of each sequence across chunk boundaries, and holds back rows of
+a gap that is still open (for linear interpolation the next valid value is
+needed) until the chunk that closes it arrives.
+
+    filler = StreamingFiller("temperature", method="linear", by="sensor_id")
+    for ready in filler.transform(chunks):   # chunks: any iterable of frames
+        write(ready)
+
+Every input row is emitted exactly once, with its original index label;
+rows held back for an open gap come out with a later chunk (or at the end).
+With by=None the whole stream is one sequence; with by="col" each key is
+its own sequence, matching df.groupby(col)[column].interpolate() / .ffill().
+"""
+
+import numpy as np
+import pandas as pd
+
+
+class StreamingFiller:
+    METHODS = ("linear", "ffill")
+
+    def __init__(self, column, method="linear", by=None):
+        if method not in self.METHODS:
+            raise ValueError(f"method must be one of {self.METHODS}, got {method!r}")
+        self.column = column
+        self.method = method
+        self.by = by
+        self.reset()
+
+    def reset(self):
+        # Per key: rows seen so far, and position/value of the last valid row.
+        self._seen = pd.Series(dtype=np.int64)
+        self._last_pos = pd.Series(dtype=np.float64)
+        self._last_value = pd.Series(dtype=object)
+        # Rows of still-open gaps and their positions in their sequence.
+        self._pending = None
+        self._pending_pos = np.empty(0, dtype=np.int64)
+        return self
+
+    def partial_transform(self, chunk):
+        # Fills what can be filled; returns the rows that are final.
+        return self._process(chunk, final=False)
+
+    def flush(self):
+        # End of stream: open gaps are final, like the tail of interpolate().
+        return self._process(None, final=True)
+
+    def transform(self, chunks):
+        for chunk in chunks:
+            ready = self.partial_transform(chunk)
+            if len(ready):
+                yield ready
+        ready = self.flush()
+        if len(ready):
+            yield ready
+
+    # ---- internals --------------------------------------------------------
+
+    def _keys(self, frame):
+        if self.by is None:
+            return pd.Series(0, index=frame.index)
+        return frame[self.by]
+
+    def _process(self, chunk, final):
+        if chunk is not None and len(chunk):
+            keys = self._keys(chunk)
+            offset = keys.map(self._seen).fillna(0).to_numpy(dtype=np.int64)
+            pos = offset + keys.groupby(keys, sort=False).cumcount().to_numpy()
+            self._seen = _update(self._seen, keys.value_counts(dropna=True))
+            frames = [chunk] if self._pending is None else [self._pending, chunk]
+            rows = pd.concat(frames) if len(frames) > 1 else chunk
+            pos = np.concatenate([self._pending_pos, pos])
+        elif self._pending is not None:
+            rows, pos = self._pending, self._pending_pos
+        else:
+            return pd.DataFrame() if chunk is None else chunk.iloc[:0]
+
+        keys = self._keys(rows)
+        series = rows[self.column]
+        if self.method == "linear":
+            values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        else:
+            values = series.to_numpy()
+        valid = pd.notna(values)
+        codes, _ = pd.factorize(keys, use_na_sentinel=True)
+
+        # Sort by (key, position) so every sequence is one contiguous run,
+        # then find each row's previous and next valid row in that run.
+        order = np.lexsort((pos, codes))
+        s_codes, s_valid = codes[order], valid[order]
+        n = len(order)
+        idx = np.arange(n)
+        prev = np.maximum.accumulate(np.where(s_valid, idx, -1))
+        nxt = np.minimum.accumulate(np.where(s_valid, idx, n)[::-1])[::-1]
+        has_prev = prev >= 0
+        has_prev[has_prev] = s_codes[prev[has_prev]] == s_codes[has_prev]
+        has_next = nxt < n
+        has_next[has_next] = s_codes[nxt[has_next]] == s_codes[has_next]
+
+        s_pos = pos[order]
+        s_values = values[order]
+        s_keys = keys.to_numpy()[order]
+        prev_pos = np.where(has_prev, s_pos[np.where(has_prev, prev, 0)], np.nan)
+        prev_val = s_values[np.where(has_prev, prev, 0)].copy()
+
+        # Rows before the first valid row of this batch continue from the
+        # last valid value carried over from earlier chunks.
+        carried = ~has_prev & ~s_valid
+        if carried.any():
+            carry_pos = pd.Series(s_keys[carried]).map(self._last_pos).to_numpy(dtype=np.float64)
+            carry_val = pd.Series(s_keys[carried]).map(self._last_value).to_numpy()
+            prev_pos[carried] = carry_pos
+            prev_val[carried] = carry_val
+            has_prev[carried] = ~np.isnan(carry_pos)
+
+        filled = s_values.copy()
+        gap = ~s_valid & has_prev & (s_codes >= 0)
+        pending = np.zeros(n, dtype=bool)
+        if self.method == "ffill":
+            filled[gap] = prev_val[gap]
+        else:
+            closed = gap & has_next
+            j = nxt[closed]
+            # Same arithmetic as np.interp, which interpolate() uses.
+            slope = (s_values[j] - prev_val[closed]) / (s_pos[j] - prev_pos[closed])
+            filled[closed] = slope * (s_pos[closed] - prev_pos[closed]) + prev_val[closed]
+            open_gap = gap & ~has_next
+            if final:
+                filled[open_gap] = prev_val[open_gap]
+            else:
+                pending = open_gap
+
+        # Carry the last valid value of every sequence to the next chunk.
+        last = s_valid & (s_codes >= 0)
+        if last.any():
+            tail = pd.DataFrame({"key": s_keys[last], "pos": s_pos[last], "value": s_values[last]})
+            tail = tail.drop_duplicates("key", keep="last").set_index("key")
+            self._last_pos = _update(self._last_pos, tail["pos"].astype(np.float64), replace=True)
+            self._last_value = _update(self._last_value, tail["value"], replace=True)
+
+        result = np.empty(n, dtype=filled.dtype)
+        result[order] = filled
+        held = np.zeros(n, dtype=bool)
+        held[order] = pending
+
+        out = rows.copy()
+        if self.method == "linear":
+            out[self.column] = result
+        else:
+            out[self.column] = pd.Series(result, index=rows.index).astype(series.dtype)
+        self._pending = out[held] if held.any() else None
+        self._pending_pos = pos[held]
+        return out[~held]
+
+
+def _update(state, new, replace=False):
+    if len(state) == 0:
+        return new
+    if replace:
+        return new.combine_first(state)
+    return state.add(new, fill_value=0).astype(state.dtype)
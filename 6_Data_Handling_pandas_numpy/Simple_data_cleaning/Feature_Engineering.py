@@ -1,12 +1,25 @@
+from feature_expressions import FeatureSpec, col
+
+
+DEFAULT_FEATURES = FeatureSpec({
+    "salary_per_experience": col("salary") / (col("experience") + 1),
+    "is_experienced": col("experience") > 2,
+})
+
+
 class FeatureEngineer:
-    def __init__(self, df):
+    def __init__(self, df, features=DEFAULT_FEATURES):
         self.df = df.copy()
+        self.features = features
+
+    @staticmethod
+    def compute_features(data, features=DEFAULT_FEATURES):
+        # `data` is a DataFrame or a dict of column arrays.
+        return features.evaluate(data)
 
     def create_features(self):
-        self.df["salary_per_experience"] = (
-            self.df["salary"] / (self.df["experience"] + 1)
-        )
-        self.df["is_experienced"] = self.df["experience"] > 2
+        for name, values in self.compute_features(self.df, self.features).items():
+            self.df[name] = values
         return self
 
     def prepare_features(self, target_column):
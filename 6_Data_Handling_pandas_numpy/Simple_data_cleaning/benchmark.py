@@ -0,0 +1,202 @@
+import argparse
+import json
+import os
+import resource
+import statistics
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from data_loader import DataLoader
+from dtype_optimizer import DtypeOptimizer
+from data_cleaner import DataCleaner
+from Feature_Engineering import FeatureEngineer
+from model_trainer import ModelTrainer
+from evaluator import Evaluator
+
+
+# Scaling benchmark for the Simple_data_cleaning stages.
+#
+#   python benchmark.py --save-baseline           # record benchmark_baseline.json
+#   python benchmark.py                           # compare, exit 1 on regression
+#   python benchmark.py --sizes 1e3 1e5 1e7 --repeats 3 --tolerance 0.2
+#
+# Every stage is timed on synthetic frames of each size, after `warmup`
+# untimed runs, over `repeats` timed runs; the median time is compared with
+# the baseline for the same stage and size.
+
+DEFAULT_SIZES = [1e3, 1e4, 1e5, 1e6]
+
+
+def make_frame(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    age = rng.normal(35, 10, rows)
+    age[rng.random(rows) < 0.01] = -1
+    age[rng.random(rows) < 0.1] = np.nan
+    salary = rng.normal(45_000, 12_000, rows)
+    salary[rng.random(rows) < 0.1] = np.nan
+    experience = rng.integers(0, 20, rows).astype(np.float64)
+    experience[rng.random(rows) < 0.1] = np.nan
+    logit = (np.nan_to_num(age, nan=35) - 35) / 10 + rng.normal(0, 1, rows)
+    return pd.DataFrame({
+        "age": age,
+        "salary": salary,
+        "experience": experience,
+        "purchased": (logit > 0).astype(np.int64),
+    })
+
+
+def peak_rss_bytes():
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    scale = 1 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+
+def reset_peak_rss():
+    # Linux only: resets VmHWM to the current RSS. Elsewhere the peak is
+    # the process-wide high-water mark.
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+def time_stage(setup, run, warmup, repeats):
+    for _ in range(warmup):
+        run(setup())
+
+    times = []
+    reset_peak_rss()
+    for _ in range(repeats):
+        state = setup()
+        start = time.perf_counter()
+        run(state)
+        times.append(time.perf_counter() - start)
+    return times, peak_rss_bytes()
+
+
+def stages(df, workdir):
+    csv_path = os.path.join(workdir, f"bench_{len(df)}.csv")
+    df.to_csv(csv_path, index=False)
+
+    clean = DataCleaner(df).handle_missing_values().remove_invalid_rows().get_clean_data()
+    X, y = FeatureEngineer(clean).create_features().prepare_features("purchased")
+    trainer = ModelTrainer()
+    trainer.train(X, y)
+
+    return {
+        "DataLoader.load": (
+            lambda: DataLoader(csv_path),
+            lambda loader: loader.load(),
+        ),
+        "DtypeOptimizer.fit_transform": (
+            lambda: DtypeOptimizer(),
+            lambda optimizer: optimizer.fit(df).transform(df),
+        ),
+        "DataCleaner.handle_missing_values": (
+            lambda: DataCleaner(df),
+            lambda cleaner: cleaner.handle_missing_values(),
+        ),
+        "DataCleaner.remove_invalid_rows": (
+            lambda: DataCleaner(df),
+            lambda cleaner: cleaner.remove_invalid_rows(),
+        ),
+        "FeatureEngineer.create_features": (
+            lambda: FeatureEngineer(clean),
+            lambda engineer: engineer.create_features(),
+        ),
+        "ModelTrainer.train": (
+            lambda: ModelTrainer(),
+            lambda t: t.train(X, y),
+        ),
+        "Evaluator.evaluate": (
+            lambda: Evaluator(trainer.model),
+            lambda evaluator: evaluator.evaluate(X, y),
+        ),
+    }
+
+
+def run_benchmarks(sizes, warmup, repeats):
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for rows in sizes:
+            df = make_frame(rows)
+            for name, (setup, run) in stages(df, workdir).items():
+                times, peak = time_stage(setup, run, warmup, repeats)
+                median = statistics.median(times)
+                results.append({
+                    "stage": name,
+                    "rows": rows,
+                    "median_seconds": median,
+                    "min_seconds": min(times),
+                    "max_seconds": max(times),
+                    "rows_per_second": rows / median if median > 0 else None,
+                    "peak_rss_bytes": peak,
+                })
+                print(f"{name:<36} {rows:>11,} rows  {median * 1000:10.2f} ms  "
+                      f"{rows / median:14,.0f} rows/s  {peak / 2**20:8.1f} MiB")
+    return results
+
+
+def compare(results, baseline, tolerance):
+    reference = {(r["stage"], r["rows"]): r["median_seconds"] for r in baseline["results"]}
+    regressions = []
+    for r in results:
+        base = reference.get((r["stage"], r["rows"]))
+        if base is not None and r["median_seconds"] > base * (1 + tolerance):
+            regressions.append(
+                f"{r['stage']} @ {r['rows']:,} rows: {r['median_seconds'] * 1000:.2f} ms "
+                f"vs baseline {base * 1000:.2f} ms (+{r['median_seconds'] / base - 1:.0%})"
+            )
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the Simple_data_cleaning stages")
+    parser.add_argument("--sizes", type=float, nargs="+", default=DEFAULT_SIZES,
+                        help="row counts, e.g. 1e3 1e5 1e8")
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed slowdown over the baseline (0.25 = 25%%)")
+    parser.add_argument("--baseline", default="benchmark_baseline.json")
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--output", help="also write this run's results to a JSON file")
+    args = parser.parse_args()
+
+    results = run_benchmarks([int(s) for s in args.sizes], args.warmup, args.repeats)
+    run = {
+        "python": sys.version.split()[0],
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(run, f, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(run, f, indent=2)
+        print(f"\nBaseline saved to {args.baseline}")
+    elif os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        if regressions:
+            print("\nRegressions beyond tolerance:")
+            for line in regressions:
+                print("  " + line)
+            sys.exit(1)
+        print(f"\nNo stage slower than baseline by more than {args.tolerance:.0%}")
+    else:
+        print(f"\nNo baseline at {args.baseline}; run with --save-baseline to create one")
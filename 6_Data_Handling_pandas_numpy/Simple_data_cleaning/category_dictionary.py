@@ -0,0 +1,143 @@
+import json
+import math
+import os
+import time
+import uuid
+import warnings
+
+import pandas as pd
+
+class CategoryDictionary:
+    # Dictionary encoding for low-cardinality text columns (department,
+    # name, ...). Such columns are stored as pandas Categoricals: small int
+    # codes plus one copy of each distinct string, so value_counts, groupby,
+    # isin and merges work on ints.
+    #
+    # The dictionary is append-only - a value keeps its code forever - and
+    # one instance is shared by every chunk it encodes. With `path` set it
+    # is also saved to JSON and loaded on start-up, so codes are identical
+    # across runs too. Saves are batched: a grown dictionary is written at
+    # most once per `save_interval` seconds, and flush() writes whatever is
+    # still pending (DataLoader calls it after its last chunk).
+    #
+    #   categories = CategoryDictionary("categories.json")
+    #   loader = DataLoader("data.csv", categories=categories)
+    #   for chunk in loader.iter_chunks():
+    #       chunk["department"].cat.codes   # same codes in every chunk/run
+    #
+    # A text column is encoded while it has at most `max_categories`
+    # distinct values and they make up at most `max_ratio` of the rows seen
+    # so far. The limits are checked the first time a column is seen and
+    # again whenever its dictionary grows; a column that outgrows them is
+    # dropped from the dictionary (with a warning) and left as text from
+    # then on.
+
+    def __init__(self, path=None, max_categories=1000, max_ratio=0.5, save_interval=5.0):
+        self.path = path
+        self.max_categories = max_categories
+        self.max_ratio = max_ratio
+        self.save_interval = save_interval
+        self.columns = {}
+        self.rows = {}
+        self._rejected = set()
+        self._index = {}
+        self._dirty = False
+        self._saved_at = time.monotonic()
+        if path is not None and os.path.exists(path):
+            with open(path) as f:
+                saved = json.load(f)
+            self.columns = saved["columns"]
+            self.rows = saved.get("rows", {})
+
+    def __contains__(self, col):
+        return col in self.columns
+
+    def dtype(self, col):
+        # The CategoricalDtype every chunk encoded so far can be aligned to.
+        return pd.CategoricalDtype(self._categories(col))
+
+    def _categories(self, col):
+        index = self._index.get(col)
+        if index is None or len(index) != len(self.columns[col]):
+            index = self._index[col] = pd.Index(self.columns[col], dtype=object)
+        return index
+
+    def _is_candidate(self, s):
+        if isinstance(s.dtype, pd.CategoricalDtype):
+            return True
+        return pd.api.types.is_string_dtype(s)
+
+    def _within_limits(self, n_unique, n_rows):
+        return n_unique <= self.max_categories and n_unique <= self.max_ratio * max(n_rows, 1)
+
+    def _reject(self, col):
+        if self.columns.pop(col, None) is not None:
+            warnings.warn(
+                f"column {col!r} exceeds max_categories={self.max_categories} or "
+                f"max_ratio={self.max_ratio}; no longer dictionary-encoded",
+                stacklevel=3,
+            )
+            self._dirty = True
+        self.rows.pop(col, None)
+        self._index.pop(col, None)
+        self._rejected.add(col)
+
+    def encode(self, chunk):
+        encoded = {}
+        for col in chunk.columns:
+            if col in self._rejected:
+                continue
+            s = chunk[col]
+            if col not in self.columns and not self._is_candidate(s):
+                self._rejected.add(col)
+                continue
+
+            # New values are appended, so existing codes never change. The
+            # limits only need rechecking when something is appended.
+            # Dictionaries saved without row counts are assumed to have
+            # just passed the ratio limit.
+            known = self.columns.get(col, [])
+            rows = self.rows.get(col, math.ceil(len(known) / self.max_ratio)) + len(s)
+            uniques = pd.unique(s.dropna().to_numpy(dtype=object))
+            unseen = uniques[self._categories(col).get_indexer(uniques) == -1] if known else uniques
+            if col not in self.columns or len(unseen):
+                if not self._within_limits(len(known) + len(unseen), rows):
+                    self._reject(col)
+                    continue
+                self.columns.setdefault(col, known).extend(unseen.tolist())
+                self._dirty = True
+            self.rows[col] = rows
+
+            categories = self._categories(col)
+            codes = categories.get_indexer(s.to_numpy(dtype=object))
+            encoded[col] = pd.Categorical.from_codes(codes, dtype=pd.CategoricalDtype(categories))
+
+        if self._dirty and time.monotonic() - self._saved_at >= self.save_interval:
+            self.flush()
+        if not encoded:
+            return chunk
+        return chunk.assign(**encoded)
+
+    def align(self, df):
+        # Earlier chunks carry a prefix of today's dictionary; widening their
+        # categories keeps the codes, and lets pd.concat keep the dtype.
+        return df.assign(**{
+            col: df[col].cat.set_categories(self._categories(col))
+            for col in df.columns
+            if col in self.columns and isinstance(df[col].dtype, pd.CategoricalDtype)
+        })
+
+    def flush(self):
+        # Writes the dictionary to `path` if it changed since the last save.
+        if self._dirty and self.path is not None:
+            self.save()
+
+    def save(self, path=None):
+        path = path or self.path
+        tmp = f"{path}.tmp-{uuid.uuid4().hex}"
+        with open(tmp, "w") as f:
+            json.dump({"columns": self.columns, "rows": self.rows}, f)
+        os.replace(tmp, path)
+        if path == self.path:
+            self._dirty = False
+            self._saved_at = time.monotonic()
@@ -1,17 +1,149 @@
+from copy import deepcopy
+
 import numpy as np
+import pandas as pd
+
+from category_dictionary import CategoryDictionary
+from instrumentation import trace_memory
+from quantile_sketch import QuantileSketch
 
 class DataCleaner:
-    def __init__(self, df):
-        self.df = df.copy()
+    def __init__(self, df=None, exact_median_limit=1_000_000, copy=True,
+                 block_rows=65_536, categories=None):
+        # copy=False hands `df` over to the cleaner: missing values are then
+        # filled directly in its buffers instead of in a copy. Frames derived
+        # from `df` are still protected by pandas' copy-on-write.
+        self.df = df.copy() if copy and df is not None else df
+        self.copy = copy
+        self.exact_median_limit = exact_median_limit
+        self.block_rows = block_rows
+        # Optional CategoryDictionary; see encode_categories().
+        self.categories = categories
+        self.bytes_allocated_ = None
+        self._sketches = {}
+        self._fill_values = None
+
+    # ---- fit / transform --------------------------------------------------
+    #
+    # fit() learns one median per numeric column from a frame or from an
+    # iterable of chunks; transform() applies those fills to any chunk.
+    # Sketches from separately fitted cleaners (e.g. one per shard) can be
+    # combined with merge().
+
+    def partial_fit(self, chunk):
+        for col in chunk.select_dtypes(include=np.number):
+            if col not in self._sketches:
+                self._sketches[col] = QuantileSketch(exact_limit=self.exact_median_limit)
+            self._sketches[col].update(chunk[col].to_numpy(dtype=np.float64, na_value=np.nan))
+        self._fill_values = None
+        return self
+
+    def fit(self, data):
+        self._sketches = {}
+        chunks = [data] if isinstance(data, pd.DataFrame) else data
+        for chunk in chunks:
+            self.partial_fit(chunk)
+        return self
+
+    def merge(self, other):
+        for col, sketch in other._sketches.items():
+            if col in self._sketches:
+                self._sketches[col].merge(sketch)
+            else:
+                self._sketches[col] = deepcopy(sketch)
+        self._fill_values = None
+        return self
+
+    @property
+    def is_fitted(self):
+        return bool(self._sketches)
+
+    @property
+    def fill_values_(self):
+        if self._fill_values is None:
+            self._fill_values = {
+                col: sketch.median()
+                for col, sketch in self._sketches.items()
+                if sketch.count > 0
+            }
+        return self._fill_values
+
+    def transform(self, chunk):
+        if not self.is_fitted:
+            raise RuntimeError("DataCleaner must be fitted before transform()")
+        chunk = chunk.fillna(_cast_fills(self.fill_values_, chunk.dtypes))
+        if self.categories is not None:
+            chunk = self.categories.encode(chunk)
+        return chunk
+
+    # ---- in-memory chain --------------------------------------------------
 
     def handle_missing_values(self):
-        for col in self.df.select_dtypes(include=np.number):
-            self.df[col].fillna(self.df[col].median(), inplace=True)
+        if not self.is_fitted:
+            self.fit(self.df)
+        if self.copy:
+            self.df = self.transform(self.df)
+        else:
+            # Medians are finalised first so bytes_allocated_ covers only
+            # the fill itself.
+            fills = self.fill_values_
+            self.bytes_allocated_ = _traced_bytes(lambda: self._fill_in_place(fills))
+        return self
+
+    def _fill_in_place(self, fills):
+        # Column by column: only the missing positions are written, through
+        # pandas' own setitem, which fills the frame's buffers in place.
+        # Nothing is gathered into a combined array and written back, and
+        # copy-on-write still copies a column first if another frame
+        # shares its buffer.
+        dtypes = self.df.dtypes
+        fills = _cast_fills(fills, dtypes)
+        for j, col in enumerate(self.df.columns):
+            # Plain NumPy int columns cannot hold NaN; floats and nullable
+            # extension columns (Int64, Float64, ...) can.
+            if col not in fills or (isinstance(dtypes.iloc[j], np.dtype) and dtypes.iloc[j].kind != "f"):
+                continue
+            # Missing positions are found a slab of rows at a time so the
+            # NaN mask stays small; no Series of the column outlives the
+            # scan, so pandas sees the buffer as unshared when writing.
+            missing = np.concatenate([
+                start + np.flatnonzero(self.df.iloc[start:start + self.block_rows, j].isna().to_numpy())
+                for start in range(0, len(self.df), self.block_rows)
+            ] or [np.empty(0, dtype=np.intp)])
+            if missing.size:
+                self.df.iloc[missing, j] = fills[col]
+
+    def encode_categories(self):
+        # Low-cardinality text columns become categoricals coded by the
+        # shared dictionary, so later grouping and filtering run on ints.
+        if self.categories is None:
+            self.categories = CategoryDictionary()
+        self.df = self.categories.encode(self.df)
+        self.categories.flush()
         return self
 
+    def valid_mask(self, data):
+        # `data` is a DataFrame or a dict of column arrays.
+        return np.asarray(data["age"] >= 0)
+
     def remove_invalid_rows(self):
-        self.df = self.df[self.df["age"] >= 0]
+        self.df = self.df[self.valid_mask(self.df)]
         return self
 
     def get_clean_data(self):
         return self.df
+
+
+def _cast_fills(fills, dtypes):
+    # Integer columns - e.g. the nullable Int8/16/32 ones DtypeOptimizer
+    # makes - only take whole numbers, so their medians are rounded.
+    return {
+        col: round(value) if col in dtypes and pd.api.types.is_integer_dtype(dtypes[col]) else value
+        for col, value in fills.items()
+    }
+
+
+def _traced_bytes(fn):
+    with trace_memory() as memory:
+        fn()
+    return memory["peak_bytes"]
@@ -1,8 +1,26 @@
+import hashlib
+import json
+import os
+import shutil
+import uuid
+
+import numpy as np
 import pandas as pd
 
+from disk_cache import evict_lru
+
 class DataLoader:
-    def __init__(self, filepath=None):
+    def __init__(self, filepath=None, dtype=None, usecols=None, chunksize=100_000,
+                 cache_dir=None, cache_max_bytes=2 * 1024 ** 3, categories=None):
         self.filepath = filepath
+        self.dtype = dtype
+        self.usecols = usecols
+        self.chunksize = chunksize
+        self.cache_dir = cache_dir
+        self.cache_max_bytes = cache_max_bytes
+        # A CategoryDictionary: low-cardinality text columns come back as
+        # categoricals with codes shared by every chunk (and run).
+        self.categories = categories
 
     def load_sample_data(self):
         data = {
@@ -12,3 +30,140 @@ class DataLoader:
             "purchased": [0, 1, 1, 0, 1]
         }
         return pd.DataFrame(data)
+
+    def _read_csv(self, **kwargs):
+        if self.filepath is None:
+            raise ValueError("DataLoader needs a filepath to read from disk")
+        return pd.read_csv(
+            self.filepath,
+            dtype=self.dtype,
+            usecols=self.usecols,
+            **kwargs
+        )
+
+    def _encode(self, df):
+        if self.categories is None:
+            return df
+        return self.categories.encode(df)
+
+    def _flush_categories(self):
+        if self.categories is not None:
+            self.categories.flush()
+
+    def load(self):
+        if self.cache_dir is None:
+            df = self._encode(self._read_csv())
+        else:
+            entry = self._cache_entry()
+            if not os.path.isdir(entry):
+                self._write_cache(self._read_csv(), entry)
+                self._evict_cache(keep=entry)
+            df = self._encode(self._read_cache(entry))
+        self._flush_categories()
+        return df
+
+    def iter_chunks(self, chunksize=None):
+        # Only one chunk of at most `chunksize` rows is alive at a time,
+        # so memory stays flat no matter how large the file is.
+        chunksize = chunksize or self.chunksize
+
+        if self.cache_dir is not None and os.path.isdir(self._cache_entry()):
+            df = self._encode(self._read_cache(self._cache_entry()))
+            self._flush_categories()
+            for start in range(0, len(df), chunksize):
+                yield df.iloc[start:start + chunksize]
+            return
+
+        with self._read_csv(chunksize=chunksize) as reader:
+            for chunk in reader:
+                yield self._encode(chunk)
+        self._flush_categories()
+
+    # ---- on-disk columnar cache -------------------------------------------
+    #
+    # One directory per parsed input, holding a .npy file per column plus a
+    # meta.json. Numeric columns are memory-mapped back on load; text and
+    # categorical columns are stored as integer codes plus their categories.
+
+    def _cache_entry(self):
+        stat = os.stat(self.filepath)
+        key = json.dumps({
+            "path": os.path.abspath(self.filepath),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "dtype": self.dtype,
+            "usecols": sorted(self.usecols) if self.usecols is not None else None,
+        }, sort_keys=True, default=str)
+        digest = hashlib.sha256(key.encode()).hexdigest()[:32]
+        return os.path.join(self.cache_dir, digest)
+
+    def _write_cache(self, df, entry):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp = f"{entry}.tmp-{uuid.uuid4().hex}"
+        os.makedirs(tmp)
+
+        columns = []
+        for i, col in enumerate(df.columns):
+            s = df[col]
+            spec = {"name": col, "dtype": str(s.dtype)}
+            base = os.path.join(tmp, str(i))
+
+            if isinstance(s.dtype, np.dtype) and s.dtype.kind in "biufcmM":
+                spec["kind"] = "array"
+                np.save(base + ".npy", s.to_numpy())
+            elif hasattr(s.array, "_mask") and hasattr(s.dtype, "numpy_dtype"):
+                # Nullable Int64/Float64/boolean: values + validity mask.
+                spec["kind"] = "masked"
+                np.save(base + ".npy", s.to_numpy(dtype=s.dtype.numpy_dtype, na_value=0))
+                np.save(base + ".mask.npy", s.isna().to_numpy())
+            else:
+                spec["kind"] = "codes"
+                codes, uniques = pd.factorize(s)
+                np.save(base + ".npy", codes.astype(np.int32))
+                np.save(base + ".cats.npy", np.asarray(uniques, dtype=object),
+                        allow_pickle=True)
+            columns.append(spec)
+
+        with open(os.path.join(tmp, "meta.json"), "w") as f:
+            json.dump({"columns": columns, "rows": len(df)}, f)
+
+        try:
+            os.rename(tmp, entry)
+        except OSError:
+            # Another process populated the same entry first.
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    def _read_cache(self, entry):
+        with open(os.path.join(entry, "meta.json")) as f:
+            meta = json.load(f)
+        os.utime(entry)  # mark as recently used for eviction
+
+        data = {}
+        for i, spec in enumerate(meta["columns"]):
+            base = os.path.join(entry, str(i))
+            # mmap_mode="c" is copy-on-write: callers may modify the arrays
+            # in place without touching the cached files.
+            values = np.load(base + ".npy", mmap_mode="c")
+
+            if spec["kind"] == "array":
+                data[spec["name"]] = values
+            elif spec["kind"] == "masked":
+                mask = np.load(base + ".mask.npy", mmap_mode="c")
+                dtype = pd.api.types.pandas_dtype(spec["dtype"])
+                data[spec["name"]] = dtype.construct_array_type()(values, mask)
+            else:
+                cats = np.load(base + ".cats.npy", allow_pickle=True)
+                values = pd.Categorical.from_codes(values, categories=cats)
+                if spec["dtype"] != "category":
+                    values = pd.Series(values).astype(spec["dtype"]).array
+                data[spec["name"]] = values
+
+        return pd.DataFrame(data, copy=False)
+
+    def _evict_cache(self, keep=None):
+        paths = [
+            os.path.join(self.cache_dir, name)
+            for name in os.listdir(self.cache_dir)
+            if ".tmp-" not in name and os.path.isdir(os.path.join(self.cache_dir, name))
+        ]
+        evict_lru(paths, self.cache_max_bytes, keep=keep)
@@ -0,0 +1,38 @@
+import os
+import shutil
+
+
+def evict_lru(paths, max_bytes, max_entries=None, keep=None):
+    # Shared eviction for the on-disk caches (DataLoader's parsed-CSV cache,
+    # ModelCache). Entries are files or directories; reading one touches its
+    # mtime, so the oldest mtime is the least recently used. Deletes entries
+    # oldest first until the rest fit in `max_bytes` and `max_entries`,
+    # never deleting `keep` (the entry just written).
+    entries = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            if os.path.isdir(path):
+                size = sum(e.stat().st_size for e in os.scandir(path))
+            else:
+                size = stat.st_size
+        except FileNotFoundError:
+            continue  # removed by another process meanwhile
+        entries.append((stat.st_mtime, size, path))
+
+    total = sum(size for _, size, _ in entries)
+    count = len(entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes and (max_entries is None or count <= max_entries):
+            break
+        if path == keep:
+            continue
+        if os.path.isdir(path):
+            shutil.rmtree(path, ignore_errors=True)
+        else:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        total -= size
+        count -= 1
@@ -0,0 +1,210 @@
+import numpy as np
+import pandas as pd
+
+_INT_TYPES = (np.int8, np.int16, np.int32, np.int64)
+
+class DtypeOptimizer:
+    # Shrinks numeric columns to the narrowest dtype that holds every value
+    # seen during fit(): int64 -> int8/16/32, integral floats -> ints,
+    # floats that survive the round trip -> float32. Integral floats with
+    # missing values become float32, or nullable Int8/16/32 with
+    # nullable_ints=True (DataCleaner rounds its median fills for those).
+    #
+    # Ranges are learnt per column and merged over chunks, so every chunk of
+    # a stream gets the same dtypes - also when the chunks arrived with
+    # different ones (an int64 chunk and a float64-with-NaN chunk of the same
+    # CSV column). transform() re-checks each value and
+    # raises ValueError rather than silently wrapping or truncating, and
+    # leaves a before/after memory_usage(deep=True) table in report_.
+    #
+    #   optimizer = DtypeOptimizer().fit(df)
+    #   df = optimizer.transform(df)
+    #   print(optimizer.report_)
+
+    def __init__(self, nullable_ints=False, float_rtol=0.0):
+        self.nullable_ints = nullable_ints
+        self.float_rtol = float_rtol  # 0.0: float32 only if lossless
+        self.report_ = None
+        self._stats = {}
+        self._plan = None
+
+    # ---- fit --------------------------------------------------------------
+
+    def partial_fit(self, chunk):
+        for col in chunk.columns:
+            values = _numeric_values(chunk[col])
+            if values is None:
+                continue
+            stats = _column_stats(values, self.float_rtol)
+            stats["dtypes"] = {chunk[col].dtype}
+            old = self._stats.get(col)
+            if old is not None:
+                stats = {
+                    "min": _nan_min(old["min"], stats["min"]),
+                    "max": _nan_max(old["max"], stats["max"]),
+                    "nan": old["nan"] or stats["nan"],
+                    "integral": old["integral"] and stats["integral"],
+                    "float32": old["float32"] and stats["float32"],
+                    "dtypes": old["dtypes"] | stats["dtypes"],
+                }
+            self._stats[col] = stats
+        self._plan = None
+        return self
+
+    def fit(self, data):
+        self._stats = {}
+        chunks = [data] if isinstance(data, pd.DataFrame) else data
+        for chunk in chunks:
+            self.partial_fit(chunk)
+        return self
+
+    @property
+    def is_fitted(self):
+        return bool(self._stats)
+
+    @property
+    def plan_(self):
+        # {column: target dtype} for the columns that change.
+        if self._plan is None:
+            self._plan = {}
+            for col, stats in self._stats.items():
+                target = self._target(stats)
+                if target is None and len(stats["dtypes"]) > 1:
+                    # Nothing narrower fits, but the chunks still need one
+                    # common dtype.
+                    float_like = stats["nan"] or not stats["integral"]
+                    target = np.dtype(np.float64 if float_like else np.int64)
+                if target is not None and stats["dtypes"] != {target}:
+                    self._plan[col] = target
+        return self._plan
+
+    def _target(self, stats):
+        if np.isnan(stats["min"]):
+            return None  # no values seen
+        int_type = _smallest_int(stats["min"], stats["max"]) if stats["integral"] else None
+        if int_type is not None:
+            if not stats["nan"]:
+                return np.dtype(int_type)
+            if self.nullable_ints:
+                return pd.api.types.pandas_dtype(np.dtype(int_type).name.capitalize())
+        if stats["float32"]:
+            return np.dtype(np.float32)
+        return None
+
+    # ---- transform --------------------------------------------------------
+
+    def transform(self, df):
+        if not self.is_fitted:
+            raise RuntimeError("DtypeOptimizer must be fitted before transform()")
+        changed = {}
+        for col, target in self.plan_.items():
+            if col in df.columns:
+                changed[col] = self._cast(col, df[col], target)
+        result = df.assign(**changed) if changed else df
+        self.report_ = memory_report(df, result)
+        return result
+
+    def _cast(self, col, series, target):
+        values = _numeric_values(series)
+        nan = np.isnan(values) if values.dtype.kind == "f" else None
+        has_nan = nan is not None and nan.any()
+
+        if target.kind in "iu":
+            finite = values[~nan] if has_nan else values
+            if finite.size:
+                info = np.iinfo(target.numpy_dtype if hasattr(target, "numpy_dtype") else target)
+                if finite.min() < info.min or finite.max() > info.max:
+                    raise ValueError(f"column {col!r} has values outside the {target} range")
+                if finite.dtype.kind == "f" and not np.array_equal(finite, np.round(finite)):
+                    raise ValueError(f"column {col!r} has non-integral values; cannot store as {target}")
+            if isinstance(target, np.dtype):
+                if has_nan:
+                    raise ValueError(f"column {col!r} has missing values; cannot store as {target}")
+                return values.astype(target)
+            mask = nan if nan is not None else np.zeros(len(values), dtype=bool)
+            return pd.arrays.IntegerArray(np.where(mask, 0, values).astype(target.numpy_dtype), mask)
+
+        if target != np.float32:
+            return values.astype(target)
+        narrow = _to_float32(values)
+        if not _within(values, narrow, self.float_rtol):
+            raise ValueError(f"column {col!r} loses precision as {target}")
+        return narrow
+
+
+def memory_report(before, after):
+    # Per-column memory_usage(deep=True) of two versions of a frame.
+    report = pd.DataFrame({
+        "dtype_before": before.dtypes.astype(str),
+        "dtype_after": after.dtypes.reindex(before.columns).astype(str),
+        "bytes_before": before.memory_usage(deep=True, index=False),
+        "bytes_after": after.memory_usage(deep=True, index=False).reindex(before.columns),
+    })
+    report.loc["TOTAL"] = ["", "", report["bytes_before"].sum(), report["bytes_after"].sum()]
+    report["saved_pct"] = (100 * (1 - report["bytes_after"] / report["bytes_before"])).round(1)
+    return report
+
+
+def _numeric_values(series):
+    dtype = series.dtype
+    if isinstance(dtype, np.dtype):
+        return series.to_numpy() if dtype.kind in "iuf" else None
+    if getattr(dtype, "kind", "O") in "iuf" and hasattr(dtype, "numpy_dtype"):
+        # Nullable Int64/Float64: NaN-backed floats.
+        return series.to_numpy(dtype=np.float64, na_value=np.nan)
+    return None
+
+
+def _column_stats(values, rtol):
+    dtype = values.dtype
+    if dtype.kind in "iu":
+        if values.size == 0:
+            return {"min": np.nan, "max": np.nan, "nan": False, "integral": True, "float32": True}
+        lo, hi = float(values.min()), float(values.max())
+        return {
+            "min": lo, "max": hi, "nan": False, "integral": True,
+            # float32 holds every integer up to 2**24 exactly.
+            "float32": max(-lo, hi) <= 2 ** 24,
+        }
+
+    nan = np.isnan(values)
+    finite = values[~nan] if nan.any() else values
+    if finite.size == 0:
+        return {"min": np.nan, "max": np.nan, "nan": bool(nan.any()),
+                "integral": True, "float32": True}
+    return {
+        "min": float(finite.min()),
+        "max": float(finite.max()),
+        "nan": bool(nan.any()),
+        "integral": bool(np.isfinite(finite).all() and np.array_equal(finite, np.round(finite))),
+        "float32": dtype == np.float32 or _within(finite, _to_float32(finite), rtol),
+    }
+
+
+def _within(values, narrow, rtol):
+    if rtol == 0:
+        return bool(np.array_equal(narrow, values, equal_nan=True))
+    with np.errstate(over="ignore", invalid="ignore"):
+        err = np.abs(narrow.astype(values.dtype) - values)
+        return bool(np.all((err <= rtol * np.abs(values)) | np.isnan(values)))
+
+
+def _to_float32(values):
+    with np.errstate(over="ignore"):
+        return values.astype(np.float32)
+
+
+def _smallest_int(lo, hi):
+    for int_type in _INT_TYPES:
+        info = np.iinfo(int_type)
+        if info.min <= lo and hi <= info.max:
+            return int_type
+    return None
+
+
+def _nan_min(a, b):
+    return b if np.isnan(a) else a if np.isnan(b) else min(a, b)
+
+
+def _nan_max(a, b):
+    return b if np.isnan(a) else a if np.isnan(b) else max(a, b)
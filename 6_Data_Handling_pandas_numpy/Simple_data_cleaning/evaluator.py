@@ -1,14 +1,108 @@
-from sklearn.metrics import accuracy_score, classification_report
+import numpy as np
+
+
+class MetricsAccumulator:
+    # Incremental confusion matrix: feed it (y_true, y_pred) batch by batch,
+    # merge accumulators from other workers, then read every metric off the
+    # matrix without revisiting the labels.
+
+    def __init__(self):
+        self.labels = np.empty(0)
+        self.matrix = np.zeros((0, 0), dtype=np.int64)
+
+    def update(self, y_true, y_pred):
+        y_true = np.asarray(y_true).ravel()
+        y_pred = np.asarray(y_pred).ravel()
+        self._add_labels(np.union1d(y_true, y_pred))
+
+        k = len(self.labels)
+        codes = np.searchsorted(self.labels, y_true) * k + np.searchsorted(self.labels, y_pred)
+        self.matrix += np.bincount(codes, minlength=k * k).reshape(k, k)
+        return self
+
+    def merge(self, other):
+        self._add_labels(other.labels)
+        idx = np.searchsorted(self.labels, other.labels)
+        self.matrix[np.ix_(idx, idx)] += other.matrix
+        return self
+
+    def _add_labels(self, labels):
+        new = np.setdiff1d(labels, self.labels)
+        if new.size == 0:
+            return
+        merged = np.union1d(self.labels, new) if self.labels.size else np.sort(new)
+        matrix = np.zeros((len(merged), len(merged)), dtype=np.int64)
+        idx = np.searchsorted(merged, self.labels)
+        matrix[np.ix_(idx, idx)] = self.matrix
+        self.labels, self.matrix = merged, matrix
+
+    @property
+    def count(self):
+        return int(self.matrix.sum())
+
+    def accuracy(self):
+        return np.trace(self.matrix) / self.count if self.count else 0.0
+
+    def precision_recall_f1(self):
+        # Per-class arrays in label order; undefined ratios are reported as
+        # 0.0, like scikit-learn's default zero_division.
+        tp = np.diag(self.matrix).astype(np.float64)
+        predicted = self.matrix.sum(axis=0)
+        support = self.matrix.sum(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            precision = np.where(predicted > 0, tp / predicted, 0.0)
+            recall = np.where(support > 0, tp / support, 0.0)
+            denom = precision + recall
+            f1 = np.where(denom > 0, 2 * precision * recall / denom, 0.0)
+        return precision, recall, f1, support
+
+    def report(self, digits=2):
+        # Same layout as sklearn.metrics.classification_report.
+        precision, recall, f1, support = self.precision_recall_f1()
+        names = [str(label) for label in self.labels]
+        total = support.sum()
+
+        headers = ["precision", "recall", "f1-score", "support"]
+        width = max([len(name) for name in names] + [len("weighted avg"), digits])
+        row_fmt = "{:>{width}s} " + " {:>9.{digits}f}" * 3 + " {:>9}\n"
+
+        report = ("{:>{width}s} " + " {:>9}" * 4).format("", *headers, width=width) + "\n\n"
+        for name, p, r, f, s in zip(names, precision, recall, f1, support):
+            report += row_fmt.format(name, p, r, f, s, width=width, digits=digits)
+        report += "\n"
+        report += ("{:>{width}s} " + " {:>9.{digits}}" * 2 + " {:>9.{digits}f}" + " {:>9}\n").format(
+            "accuracy", "", "", self.accuracy(), total, width=width, digits=digits
+        )
+        for name, weights in (("macro avg", None), ("weighted avg", support)):
+            averages = [
+                np.average(values, weights=weights) if total else 0.0
+                for values in (precision, recall, f1)
+            ]
+            report += row_fmt.format(name, *averages, total, width=width, digits=digits)
+        return report
 
 
 class Evaluator:
     def __init__(self, model):
         self.model = model
 
-    def evaluate(self, X_test, y_test):
-        predictions = self.model.predict(X_test)
+    def evaluate(self, X_test, y_test, batch_size=None):
+        metrics = MetricsAccumulator()
+        if batch_size is None:
+            metrics.update(y_test, self.model.predict(X_test))
+        else:
+            for start in range(0, len(y_test), batch_size):
+                stop = start + batch_size
+                X = X_test.iloc[start:stop] if hasattr(X_test, "iloc") else X_test[start:stop]
+                y = y_test.iloc[start:stop] if hasattr(y_test, "iloc") else y_test[start:stop]
+                metrics.update(y, self.model.predict(X))
 
-        accuracy = accuracy_score(y_test, predictions)
-        report = classification_report(y_test, predictions)
+        return metrics.accuracy(), metrics.report()
 
-        return accuracy, report
+    def evaluate_batches(self, batches):
+        # `batches` yields (X, y) chunks, e.g. LazyPipeline.iter_batches();
+        # only one chunk of predictions is held at a time.
+        metrics = MetricsAccumulator()
+        for X, y in batches:
+            metrics.update(y, self.model.predict(X))
+        return metrics
@@ -0,0 +1,283 @@
+import numpy as np
+
+
+# Derived features are written as expressions over columns,
+#
+#   spec = FeatureSpec({
+#       "salary_per_experience": col("salary") / (col("experience") + 1),
+#       "is_experienced": col("experience") > 2,
+#   })
+#   features = spec.evaluate(df)
+#
+# and compiled once into a flat program of NumPy ufunc calls. Identical
+# subexpressions are computed once, every call writes through `out=` into a
+# small reusable buffer (or straight into the output column), and the frame
+# is walked in row blocks sized to stay in cache.
+
+_BOOL_UFUNCS = {
+    np.less, np.less_equal, np.greater, np.greater_equal, np.equal, np.not_equal,
+    np.logical_and, np.logical_or, np.logical_not, np.isnan,
+}
+
+
+class Expr:
+    def __add__(self, other):
+        return Op(np.add, self, other)
+
+    def __radd__(self, other):
+        return Op(np.add, other, self)
+
+    def __sub__(self, other):
+        return Op(np.subtract, self, other)
+
+    def __rsub__(self, other):
+        return Op(np.subtract, other, self)
+
+    def __mul__(self, other):
+        return Op(np.multiply, self, other)
+
+    def __rmul__(self, other):
+        return Op(np.multiply, other, self)
+
+    def __truediv__(self, other):
+        return Op(np.divide, self, other)
+
+    def __rtruediv__(self, other):
+        return Op(np.divide, other, self)
+
+    def __pow__(self, other):
+        return Op(np.power, self, other)
+
+    def __neg__(self):
+        return Op(np.negative, self)
+
+    def __abs__(self):
+        return Op(np.absolute, self)
+
+    def __lt__(self, other):
+        return Op(np.less, self, other)
+
+    def __le__(self, other):
+        return Op(np.less_equal, self, other)
+
+    def __gt__(self, other):
+        return Op(np.greater, self, other)
+
+    def __ge__(self, other):
+        return Op(np.greater_equal, self, other)
+
+    def __eq__(self, other):
+        return Op(np.equal, self, other)
+
+    def __ne__(self, other):
+        return Op(np.not_equal, self, other)
+
+    def __and__(self, other):
+        return Op(np.logical_and, self, other)
+
+    def __or__(self, other):
+        return Op(np.logical_or, self, other)
+
+    def __invert__(self):
+        return Op(np.logical_not, self)
+
+    __hash__ = object.__hash__
+
+
+class Col(Expr):
+    def __init__(self, name):
+        self.name = name
+        self.key = ("col", name)
+        self.args = ()
+
+    def __repr__(self):
+        return f"col({self.name!r})"
+
+
+class Const(Expr):
+    def __init__(self, value):
+        self.value = value
+        self.key = ("const", value)
+        self.args = ()
+
+    def __repr__(self):
+        return repr(self.value)
+
+
+class Op(Expr):
+    def __init__(self, func, *args):
+        self.func = func
+        self.args = tuple(_wrap(a) for a in args)
+        self.key = (func.__name__,) + tuple(a.key for a in self.args)
+
+    def __repr__(self):
+        return f"{self.func.__name__}({', '.join(map(repr, self.args))})"
+
+
+def col(name):
+    return Col(name)
+
+
+def where(cond, a, b):
+    return Op(_where, cond, a, b)
+
+
+def log(expr):
+    return Op(np.log, expr)
+
+
+def log1p(expr):
+    return Op(np.log1p, expr)
+
+
+def exp(expr):
+    return Op(np.exp, expr)
+
+
+def sqrt(expr):
+    return Op(np.sqrt, expr)
+
+
+def isnan(expr):
+    return Op(np.isnan, expr)
+
+
+def _where(cond, a, b, out):
+    np.copyto(out, b)
+    np.copyto(out, a, where=cond)
+    return out
+
+
+def _wrap(value):
+    return value if isinstance(value, Expr) else Const(value)
+
+
+class FeatureSpec:
+    def __init__(self, features, dtype=np.float64, cache_bytes=1 << 20):
+        self.features = {name: _wrap(expr) for name, expr in features.items()}
+        self.dtype = np.dtype(dtype)
+        self.cache_bytes = cache_bytes
+        self._compile()
+
+    @property
+    def columns(self):
+        return [node.name for node in self._nodes.values() if isinstance(node, Col)]
+
+    def __repr__(self):
+        body = ",\n".join(f"    {name!r}: {expr!r}" for name, expr in self.features.items())
+        return f"FeatureSpec({{\n{body}\n}}, dtype={self.dtype})"
+
+    def _result_dtype(self, node):
+        if isinstance(node, Op) and node.func in _BOOL_UFUNCS:
+            return np.dtype(bool)
+        return self.dtype
+
+    def _compile(self):
+        # Post-order walk with common subexpression elimination on node keys.
+        nodes = {}
+
+        def visit(expr, root=False):
+            # Constants are inlined into the ops that use them; only a
+            # constant feature needs a program step of its own (a fill).
+            if (isinstance(expr, Const) and not root) or expr.key in nodes:
+                return
+            for arg in expr.args:
+                visit(arg)
+            nodes[expr.key] = expr
+
+        for expr in self.features.values():
+            visit(expr, root=True)
+        order = list(nodes.values())
+
+        self._roots = {}
+        for name, expr in self.features.items():
+            self._roots.setdefault(expr.key, []).append(name)
+
+        last_use = {}
+        for i, node in enumerate(order):
+            for arg in node.args:
+                last_use[arg.key] = i
+
+        # Give every non-output intermediate a block buffer, recycling a
+        # buffer of the same dtype once its last consumer has run.
+        free, slot_dtypes, slot_of, program = {}, [], {}, []
+        for i, node in enumerate(order):
+            slot = None
+            if node.key not in self._roots:
+                dtype = self._result_dtype(node)
+                if free.get(dtype):
+                    slot = free[dtype].pop()
+                else:
+                    slot = len(slot_dtypes)
+                    slot_dtypes.append(dtype)
+            program.append((node, slot))
+            slot_of[node.key] = slot
+
+            for arg in dict.fromkeys(a.key for a in node.args):
+                arg_slot = slot_of.get(arg)
+                if last_use.get(arg) == i and arg_slot is not None:
+                    free.setdefault(slot_dtypes[arg_slot], []).append(arg_slot)
+
+        self._program = program
+        self._nodes = nodes
+        self._slot_dtypes = slot_dtypes
+
+        n_buffers = len(slot_dtypes) + len(self._roots)
+        self.block_rows = max(1024, self.cache_bytes // (self.dtype.itemsize * max(n_buffers, 1)))
+
+    def evaluate(self, data, out=None):
+        # `data` is a DataFrame or a dict of column arrays. `out` may hold
+        # preallocated output arrays keyed by feature name.
+        arrays = {name: _column_array(data[name]) for name in self.columns}
+        if arrays:
+            n = len(next(iter(arrays.values())))
+        else:
+            n = len(data) if hasattr(data, "index") else len(next(iter(data.values()), ()))
+
+        out = dict(out or {})
+        for key, names in self._roots.items():
+            dtype = self._result_dtype(self._nodes[key])
+            for name in names:
+                if name not in out:
+                    out[name] = np.empty(n, dtype=dtype)
+
+        buffers = [np.empty(min(self.block_rows, n), dtype=dtype) for dtype in self._slot_dtypes]
+
+        for start in range(0, n, self.block_rows):
+            stop = min(start + self.block_rows, n)
+            m = stop - start
+            values = {}
+
+            for node, slot in self._program:
+                names = self._roots.get(node.key)
+                target = out[names[0]][start:stop] if names else buffers[slot][:m]
+
+                if isinstance(node, Const):
+                    target[...] = node.value
+                elif isinstance(node, Col):
+                    src = arrays[node.name][start:stop]
+                    if names is None and src.dtype == self.dtype:
+                        target = src
+                    else:
+                        np.copyto(target, src, casting="unsafe")
+                else:
+                    args = [
+                        a.value if isinstance(a, Const) else values[a.key]
+                        for a in node.args
+                    ]
+                    node.func(*args, out=target)
+                values[node.key] = target
+
+            for names in self._roots.values():
+                for name in names[1:]:
+                    np.copyto(out[name][start:stop], out[names[0]][start:stop])
+
+        return out
+
+
+def _column_array(values):
+    if hasattr(values, "to_numpy"):
+        if isinstance(values.dtype, np.dtype):
+            return values.to_numpy()
+        return values.to_numpy(dtype=np.float64, na_value=np.nan)
+    return np.asarray(values)
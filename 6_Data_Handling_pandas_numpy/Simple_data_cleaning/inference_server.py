@@ -0,0 +1,185 @@
+import argparse
+import asyncio
+import collections
+import json
+import time
+
+import numpy as np
+import pandas as pd
+
+from model_trainer import ModelTrainer
+
+
+# Local HTTP scoring service for a model saved with ModelTrainer.save().
+#
+#   python inference_server.py model.joblib --port 8000
+#   curl -d '{"features": {"age": 30, "salary": 40000, ...}}' localhost:8000/predict
+#   curl localhost:8000/metrics
+#
+# Concurrent single-row requests are queued and scored together: a batch is
+# sent to model.predict as soon as it holds max_batch_size rows or its first
+# row has waited max_wait_ms, whichever comes first.
+
+
+class MicroBatcher:
+    def __init__(self, model, max_batch_size=64, max_wait_ms=2.0, latency_window=10_000):
+        self.model = model
+        self.feature_names = list(getattr(model, "feature_names_in_", []))
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.latencies = collections.deque(maxlen=latency_window)
+        self.batch_sizes = collections.deque(maxlen=latency_window)
+        self.requests = 0
+        self._queue = None
+        self._task = None
+
+    async def start(self):
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        self._task.cancel()
+
+    async def predict(self, row):
+        start = time.perf_counter()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((self._to_vector(row), future))
+        try:
+            return await future
+        finally:
+            self.latencies.append(time.perf_counter() - start)
+            self.requests += 1
+
+    def _to_vector(self, row):
+        if isinstance(row, dict):
+            if not self.feature_names:
+                raise ValueError("model has no feature names; send a list of values")
+            return [float(row[name]) for name in self.feature_names]
+        row = [float(value) for value in row]
+        if len(row) != self.model.n_features_in_:
+            raise ValueError(f"expected {self.model.n_features_in_} features, got {len(row)}")
+        return row
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            rows, futures = zip(*batch)
+            self.batch_sizes.append(len(batch))
+            try:
+                # predict runs in a worker thread so the loop keeps accepting
+                # requests (and filling the next batch) meanwhile.
+                predictions = await loop.run_in_executor(None, self._predict, rows)
+            except Exception as exc:
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+            for future, prediction in zip(futures, predictions):
+                if not future.done():
+                    future.set_result(prediction.item())
+
+    def _predict(self, rows):
+        X = np.asarray(rows, dtype=np.float64)
+        if self.feature_names:
+            X = pd.DataFrame(X, columns=self.feature_names, copy=False)
+        return self.model.predict(X)
+
+    def metrics(self):
+        latencies = np.asarray(self.latencies) * 1000
+        stats = {
+            "requests": self.requests,
+            "batches": len(self.batch_sizes),
+            "mean_batch_size": float(np.mean(self.batch_sizes)) if self.batch_sizes else 0.0,
+        }
+        for q in (50, 90, 99, 99.9):
+            stats[f"latency_p{q}_ms"] = float(np.percentile(latencies, q)) if latencies.size else None
+        return stats
+
+
+class InferenceServer:
+    def __init__(self, model, host="127.0.0.1", port=8000, **batcher_options):
+        self.host = host
+        self.port = port
+        self.batcher = MicroBatcher(model, **batcher_options)
+
+    async def serve_forever(self):
+        await self.batcher.start()
+        server = await asyncio.start_server(self._handle, self.host, self.port)
+        async with server:
+            await server.serve_forever()
+
+    async def _handle(self, reader, writer):
+        try:
+            # HTTP/1.1 keep-alive: serve requests until the client closes.
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode("latin-1").split(" ", 2)
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+
+                status, payload = await self._route(method, path, body)
+                data = json.dumps(payload).encode()
+                writer.write(
+                    f"HTTP/1.1 {status}\r\n"
+                    f"Content-Type: application/json\r\n"
+                    f"Content-Length: {len(data)}\r\n\r\n".encode() + data
+                )
+                await writer.drain()
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _route(self, method, path, body):
+        if method == "GET" and path == "/metrics":
+            return "200 OK", self.batcher.metrics()
+        if method == "POST" and path == "/predict":
+            try:
+                request = json.loads(body)
+                prediction = await self.batcher.predict(request["features"])
+            except (ValueError, KeyError, TypeError) as exc:
+                return "400 Bad Request", {"error": str(exc)}
+            return "200 OK", {"prediction": prediction}
+        return "404 Not Found", {"error": f"no route for {method} {path}"}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve a saved model over HTTP")
+    parser.add_argument("model_path")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--max-batch-size", type=int, default=64)
+    parser.add_argument("--max-wait-ms", type=float, default=2.0)
+    args = parser.parse_args()
+
+    server = InferenceServer(
+        ModelTrainer.load(args.model_path),
+        host=args.host,
+        port=args.port,
+        max_batch_size=args.max_batch_size,
+        max_wait_ms=args.max_wait_ms,
+    )
+    print(f"Serving {args.model_path} on http://{args.host}:{args.port}")
+    asyncio.run(server.serve_forever())
@@ -0,0 +1,105 @@
+import json
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+
+class StageRecorder:
+    # Records wall time, CPU time, memory and row counts per pipeline stage:
+    #
+    #   recorder = StageRecorder()
+    #   with recorder.stage("clean", rows_in=len(df)) as stage:
+    #       clean_df = DataCleaner(df)...get_clean_data()
+    #       stage["rows_out"] = len(clean_df)
+    #   recorder.write_json("metrics.json")
+    #   recorder.write_prometheus("pipeline.prom")
+    #
+    # Memory comes from tracemalloc: `peak_bytes` is the highest traced
+    # allocation above the level at stage start, `allocated_bytes` what the
+    # stage still holds when it ends.
+
+    def __init__(self, pipeline="simple_data_cleaning"):
+        self.pipeline = pipeline
+        self.stages = []
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @contextmanager
+    def stage(self, name, rows_in=None):
+        record = {"stage": name, "rows_in": rows_in, "rows_out": None}
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        try:
+            with trace_memory() as memory:
+                yield record
+        finally:
+            record["wall_seconds"] = time.perf_counter() - wall
+            record["cpu_seconds"] = time.process_time() - cpu
+            record.update(memory)
+            self.stages.append(record)
+
+    def write_json(self, path):
+        with open(path, "w") as f:
+            json.dump({"pipeline": self.pipeline, "stages": self.stages}, f, indent=2)
+
+    def write_prometheus(self, path):
+        # Textfile-collector format. Written to a temp file and renamed so
+        # the node exporter never reads a half-written file.
+        metrics = [
+            ("wall_seconds", "Wall-clock time of the stage"),
+            ("cpu_seconds", "Process CPU time of the stage"),
+            ("peak_bytes", "Peak traced memory above the stage's starting level"),
+            ("allocated_bytes", "Traced memory still held at the end of the stage"),
+            ("rows_in", "Rows entering the stage"),
+            ("rows_out", "Rows leaving the stage"),
+        ]
+        lines = []
+        for key, help_text in metrics:
+            name = f"pipeline_stage_{key}"
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} gauge")
+            for record in self.stages:
+                if record[key] is not None:
+                    lines.append(
+                        f'{name}{{pipeline="{self.pipeline}",stage="{record["stage"]}"}} '
+                        f"{record[key]}"
+                    )
+
+        with open(path + ".tmp", "w") as f:
+            f.write("\n".join(lines) + "\n")
+        os.replace(path + ".tmp", path)
+
+
+# Measurements in progress, outermost first. tracemalloc has a single,
+# global peak counter; before a nested measurement resets it, the peak so
+# far is folded into every open measurement so none of them loses it.
+_open_traces = []
+
+
+@contextmanager
+def trace_memory():
+    # Yields a dict that, on exit, holds `peak_bytes` (highest traced
+    # allocation above the starting level) and `allocated_bytes` (what is
+    # still held). Safe to nest, e.g. a DataCleaner measuring itself inside
+    # a recorded stage.
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    before, peak = tracemalloc.get_traced_memory()
+    for trace in _open_traces:
+        trace["peak"] = max(trace["peak"], peak)
+    tracemalloc.reset_peak()
+
+    trace = {"peak": before}
+    _open_traces.append(trace)
+    result = {}
+    try:
+        yield result
+    finally:
+        after, peak = tracemalloc.get_traced_memory()
+        _open_traces.remove(trace)
+        result["peak_bytes"] = max(max(trace["peak"], peak) - before, 0)
+        result["allocated_bytes"] = after - before
+        if started:
+            tracemalloc.stop()
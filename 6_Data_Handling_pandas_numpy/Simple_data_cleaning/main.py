@@ -1,35 +1,64 @@
 from data_loader import DataLoader
 from data_cleaner import DataCleaner
+from dtype_optimizer import DtypeOptimizer
 from Feature_Engineering import FeatureEngineer
 from model_trainer import ModelTrainer
+from model_cache import ModelCache
 from evaluator import Evaluator
+from instrumentation import StageRecorder
+
+recorder = StageRecorder()
 
 # 1. Load data
-df = DataLoader().load_sample_data()
-
-# 2. Clean data
-clean_df = (
-    DataCleaner(df)
-    .handle_missing_values()
-    .remove_invalid_rows()
-    .get_clean_data()
-)
-
-# 3. Feature engineering
-X, y = (
-    FeatureEngineer(clean_df)
-    .create_features()
-    .prepare_features("purchased")
-)
-
-# 4. Train model
-trainer = ModelTrainer()
-X_train, X_test, y_train, y_test = trainer.split_data(X, y)
-trainer.train(X_train, y_train)
-
-# 5. Evaluate model
-evaluator = Evaluator(trainer.model)
-accuracy, report = evaluator.evaluate(X_test, y_test)
+with recorder.stage("load") as stage:
+    df = DataLoader().load_sample_data()
+    stage["rows_out"] = len(df)
+
+# 2. Narrow dtypes before cleaning
+with recorder.stage("optimize", rows_in=len(df)) as stage:
+    optimizer = DtypeOptimizer()
+    df = optimizer.fit(df).transform(df)
+    stage["rows_out"] = len(df)
+print("Memory before/after dtype optimization:\n", optimizer.report_, "\n")
+
+# 3. Clean data
+with recorder.stage("clean", rows_in=len(df)) as stage:
+    clean_df = (
+        DataCleaner(df)
+        .handle_missing_values()
+        .remove_invalid_rows()
+        .get_clean_data()
+    )
+    stage["rows_out"] = len(clean_df)
+
+# 4. Feature engineering
+with recorder.stage("feature", rows_in=len(clean_df)) as stage:
+    X, y = (
+        FeatureEngineer(clean_df)
+        .create_features()
+        .prepare_features("purchased")
+    )
+    stage["rows_out"] = len(X)
+
+# 5. Train model
+with recorder.stage("train", rows_in=len(X)) as stage:
+    trainer = ModelTrainer()
+    X_train, X_test, y_train, y_test = trainer.split_data(X, y)
+    trainer.train(X_train, y_train, cache=ModelCache("model_cache"))
+    stage["rows_out"] = len(X_train)
+
+# 6. Evaluate model
+with recorder.stage("evaluate", rows_in=len(X_test)) as stage:
+    evaluator = Evaluator(trainer.model)
+    accuracy, report = evaluator.evaluate(X_test, y_test)
+    stage["rows_out"] = len(X_test)
 
 print("Accuracy:", accuracy)
 print("\nClassification Report:\n", report)
+
+# 7. Persist model (serve it with: python inference_server.py model.joblib)
+trainer.save("model.joblib")
+
+# 8. Stage metrics for dashboards and the node exporter's textfile collector
+recorder.write_json("pipeline_metrics.json")
+recorder.write_prometheus("pipeline_metrics.prom")
@@ -0,0 +1,97 @@
+import hashlib
+import os
+import uuid
+
+import joblib
+import numpy as np
+import pandas as pd
+import sklearn
+
+from disk_cache import evict_lru
+
+
+class ModelCache:
+    # On-disk cache of fitted models, keyed by what went into the fit:
+    # a fingerprint of the training arrays, the estimator class and
+    # parameters, and the scikit-learn version. Entries are evicted least
+    # recently used first once there are more than `max_entries` of them or
+    # they take more than `max_bytes` on disk.
+
+    def __init__(self, cache_dir, max_bytes=1024 ** 3, max_entries=64,
+                 hash_chunk_bytes=16 * 1024 ** 2):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.hash_chunk_bytes = hash_chunk_bytes
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def key(self, model, X, y):
+        h = hashlib.blake2b(digest_size=20)
+        h.update(f"sklearn={sklearn.__version__};{type(model).__module__}."
+                 f"{type(model).__qualname__}".encode())
+        h.update(repr(sorted(model.get_params(deep=True).items())).encode())
+        self._hash_data(h, X)
+        self._hash_data(h, y)
+        return h.hexdigest()
+
+    def _hash_data(self, h, data):
+        if isinstance(data, pd.DataFrame):
+            h.update(repr(list(data.columns)).encode())
+            for col in data.columns:
+                self._hash_data(h, data[col])
+            return
+        if isinstance(data, pd.Series):
+            if isinstance(data.dtype, np.dtype) and data.dtype.kind != "O":
+                data = data.to_numpy()
+            else:
+                h.update(str(data.dtype).encode())
+                data = pd.util.hash_pandas_object(data, index=False).to_numpy()
+
+        array = np.asarray(data)
+        h.update(f"{array.dtype.str}{array.shape}".encode())
+        if array.dtype.kind == "O":
+            array = pd.util.hash_pandas_object(pd.Series(array.ravel()), index=False).to_numpy()
+
+        # Feed the raw bytes in slices of rows: no copy for contiguous
+        # arrays, and a bounded one per slice otherwise.
+        array = np.atleast_1d(array)
+        row_bytes = max(array[:1].nbytes, 1)
+        step = max(1, self.hash_chunk_bytes // row_bytes)
+        for start in range(0, len(array), step):
+            h.update(np.ascontiguousarray(array[start:start + step]).data)
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.joblib")
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            model = joblib.load(path)
+        except FileNotFoundError:
+            return None
+        try:
+            os.utime(path)  # mark as recently used
+        except FileNotFoundError:
+            pass  # evicted by another process since the load
+        return model
+
+    def put(self, key, model):
+        # Concurrent writers of one key each dump to their own temp file; the
+        # entry is identical either way, so whichever replace lands last wins.
+        path = self._path(key)
+        tmp = f"{path}.tmp-{uuid.uuid4().hex}"
+        try:
+            joblib.dump(model, tmp)
+            os.replace(tmp, path)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        self._evict(keep=path)
+
+    def _evict(self, keep=None):
+        paths = [
+            os.path.join(self.cache_dir, name)
+            for name in os.listdir(self.cache_dir)
+            if name.endswith(".joblib")
+        ]
+        evict_lru(paths, self.max_bytes, self.max_entries, keep=keep)
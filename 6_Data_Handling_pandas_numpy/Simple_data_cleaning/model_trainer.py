@@ -1,5 +1,17 @@
-from sklearn.linear_model import LogisticRegression
-from sklearn.model_selection import train_test_split
+import glob
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import joblib
+import numpy as np
+from sklearn.base import clone
+from sklearn.linear_model import LogisticRegression, SGDClassifier
+from sklearn.model_selection import ParameterGrid, StratifiedKFold, train_test_split
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
 
 
 class ModelTrainer:
@@ -8,6 +20,8 @@ class ModelTrainer:
         self.random_state = random_state
         self.model = LogisticRegression()
         self.is_trained = False
+        self.cv_results_ = None
+        self.best_params_ = None
 
     def split_data(self, X, y):
         return train_test_split(
@@ -16,6 +30,179 @@ class ModelTrainer:
             random_state=self.random_state
         )
 
-    def train(self, X_train, y_train):
+    def train(self, X_train, y_train, cache=None):
+        # With a ModelCache, an identical fit (same data, parameters and
+        # library version) is loaded from disk instead of being rerun.
+        if cache is not None:
+            key = cache.key(self.model, X_train, y_train)
+            cached = cache.get(key)
+            if cached is not None:
+                self.model = cached
+                self.is_trained = True
+                return
+
         self.model.fit(X_train, y_train)
         self.is_trained = True
+
+        if cache is not None:
+            cache.put(key, self.model)
+
+    def save(self, path):
+        if not self.is_trained:
+            raise Exception("Model is not trained yet!")
+        joblib.dump(self.model, path + ".tmp")
+        os.replace(path + ".tmp", path)
+
+    @staticmethod
+    def load(path):
+        return joblib.load(path)
+
+    def train_incremental(self, batches, classes, epochs=5, model=None,
+                          checkpoint_dir=None, shuffle_buffer=8, scale=True):
+        # Out-of-core training: `batches` is a LazyPipeline (or any zero-arg
+        # callable) yielding (X, y) chunks, re-read once per epoch. Chunks are
+        # shuffled through a buffer of `shuffle_buffer` chunks and rows within
+        # each chunk. With checkpoint_dir set, the model is saved after every
+        # epoch and a rerun resumes from the last saved epoch.
+        #
+        # SGD needs standardized features (salary is ~45,000, age ~35), so
+        # with scale=True a StandardScaler is fitted in one extra pass first
+        # and every chunk is scaled before partial_fit. self.model is then a
+        # scaler + model Pipeline that predicts on raw features.
+        iter_batches = batches.iter_batches if hasattr(batches, "iter_batches") else batches
+        if model is None:
+            model = SGDClassifier(loss="log_loss", random_state=self.random_state)
+        scaler = StandardScaler() if scale else None
+
+        first_epoch = 0
+        if checkpoint_dir is not None:
+            os.makedirs(checkpoint_dir, exist_ok=True)
+            saved = sorted(glob.glob(os.path.join(checkpoint_dir, "epoch_*.joblib")))
+            if saved:
+                loaded = joblib.load(saved[-1])
+                if isinstance(loaded, Pipeline):
+                    scaler, model = loaded[0], loaded[-1]
+                else:
+                    scaler, model = None, loaded
+                self.is_trained = True  # even if no epochs are left to run
+                first_epoch = int(os.path.basename(saved[-1])[6:-7]) + 1
+
+        if scaler is not None and not hasattr(scaler, "n_samples_seen_"):
+            for X, _ in iter_batches():
+                scaler.partial_fit(X)
+        self.model = Pipeline([("scale", scaler), ("model", model)]) if scaler is not None else model
+
+        for epoch in range(first_epoch, epochs):
+            # random_state=None shuffles differently on every run, as elsewhere.
+            rng = random.Random(None if self.random_state is None else self.random_state + epoch)
+            for X, y in _shuffled(iter_batches(), rng, shuffle_buffer):
+                model.partial_fit(scaler.transform(X) if scaler is not None else X, y, classes=classes)
+            self.is_trained = True
+
+            if checkpoint_dir is not None:
+                path = os.path.join(checkpoint_dir, f"epoch_{epoch:04d}.joblib")
+                joblib.dump(self.model, path + ".tmp")
+                os.replace(path + ".tmp", path)
+
+        return self
+
+    def search(self, X, y, param_grid, cv=5, n_jobs=None):
+        # Grid search with k-fold cross-validation on a process pool. X, y and
+        # the fold assignment are copied once into shared memory; each task
+        # only ships its parameters and a fold number to the worker. The final
+        # refit uses the caller's X, so a DataFrame's feature names are kept.
+        X_shared = np.ascontiguousarray(X, dtype=np.float64)
+        y_shared = np.ascontiguousarray(y)
+        folds = np.empty(len(y_shared), dtype=np.int32)
+        splitter = StratifiedKFold(n_splits=cv, shuffle=True, random_state=self.random_state)
+        for k, (_, test_idx) in enumerate(splitter.split(X_shared, y_shared)):
+            folds[test_idx] = k
+
+        candidates = list(ParameterGrid(param_grid))
+        tasks = [(params, k) for params in candidates for k in range(cv)]
+
+        blocks = [_to_shared(a) for a in (X_shared, y_shared, folds)]
+        try:
+            specs = [(shm.name, a.shape, a.dtype.str) for shm, a in blocks]
+            with ProcessPoolExecutor(
+                max_workers=n_jobs or os.cpu_count(),
+                initializer=_attach_worker,
+                initargs=(self.model, specs),
+            ) as pool:
+                results = list(pool.map(_fit_fold, *zip(*tasks)))
+        finally:
+            for shm, _ in blocks:
+                shm.close()
+                shm.unlink()
+
+        self.cv_results_ = results
+        mean_scores = [
+            np.mean([r["score"] for r in results if r["params"] == params])
+            for params in candidates
+        ]
+        self.best_params_ = candidates[int(np.argmax(mean_scores))]
+
+        self.model = clone(self.model).set_params(**self.best_params_)
+        self.train(X, y)
+        return self.cv_results_
+
+
+def _shuffled(batches, rng, buffer_size):
+    buffer = []
+    for batch in batches:
+        buffer.append(batch)
+        if len(buffer) >= buffer_size:
+            yield _permute_rows(buffer.pop(rng.randrange(len(buffer))), rng)
+    rng.shuffle(buffer)
+    for batch in buffer:
+        yield _permute_rows(batch, rng)
+
+
+def _permute_rows(batch, rng):
+    X, y = batch
+    order = np.random.default_rng(rng.getrandbits(32)).permutation(len(y))
+    if hasattr(X, "iloc"):
+        return X.iloc[order], y.iloc[order]
+    return X[order], np.asarray(y)[order]
+
+
+def _to_shared(array):
+    shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[...] = array
+    return shm, array
+
+
+# Per-worker state, set once by the pool initializer.
+_worker = {}
+
+
+def _attach_worker(model, specs):
+    _worker["model"] = model
+    _worker["shm"] = [shared_memory.SharedMemory(name=name) for name, _, _ in specs]
+    _worker["X"], _worker["y"], _worker["folds"] = [
+        np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+        for shm, (_, shape, dtype) in zip(_worker["shm"], specs)
+    ]
+
+
+def _fit_fold(params, fold):
+    X, y, folds = _worker["X"], _worker["y"], _worker["folds"]
+    test = folds == fold
+
+    model = clone(_worker["model"]).set_params(**params)
+    start = time.perf_counter()
+    model.fit(X[~test], y[~test])
+    fit_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    score = model.score(X[test], y[test])
+    score_time = time.perf_counter() - start
+
+    return {
+        "params": params,
+        "fold": fold,
+        "score": score,
+        "fit_time": fit_time,
+        "score_time": score_time,
+        "worker_pid": os.getpid(),
+    }
@@ -0,0 +1,153 @@
+import numpy as np
+import pandas as pd
+
+from data_cleaner import DataCleaner
+from data_loader import DataLoader
+from dtype_optimizer import DtypeOptimizer
+from Feature_Engineering import DEFAULT_FEATURES, FeatureEngineer
+
+
+class LazyPipeline:
+    # Records the DataCleaner -> FeatureEngineer chain as a plan and runs it
+    # fused, one chunk at a time. Each chunk is held as a dict of column
+    # arrays; a step only allocates the columns it rewrites, and nothing is
+    # materialised as a whole frame until the final (X, y) of the chunk.
+    #
+    #   plan = (LazyPipeline(DataLoader("data.csv"))
+    #           .optimize_dtypes()
+    #           .handle_missing_values()
+    #           .remove_invalid_rows()
+    #           .create_features()
+    #           .prepare_features("purchased"))
+    #   for X, y in plan.iter_batches():
+    #       ...
+
+    def __init__(self, source, chunksize=100_000, cleaner=None):
+        self.source = source
+        self.chunksize = chunksize
+        self.cleaner = cleaner if cleaner is not None else DataCleaner(copy=False)
+        self.steps = []
+        self.target_column = None
+        self.features = DEFAULT_FEATURES
+        self.optimizer = None
+
+    # ---- plan building ----------------------------------------------------
+
+    def optimize_dtypes(self, optimizer=None):
+        # Narrows dtypes as the chunk enters the plan, so every later step
+        # (and the cleaner's statistics) works on the smaller columns.
+        if self.steps:
+            raise ValueError("optimize_dtypes() must be the first step of the plan")
+        self.optimizer = optimizer if optimizer is not None else DtypeOptimizer()
+        self.steps.append("optimize_dtypes")
+        return self
+
+    def handle_missing_values(self):
+        self.steps.append("handle_missing_values")
+        return self
+
+    def remove_invalid_rows(self):
+        self.steps.append("remove_invalid_rows")
+        return self
+
+    def create_features(self, features=DEFAULT_FEATURES):
+        self.features = features
+        self.steps.append("create_features")
+        return self
+
+    def prepare_features(self, target_column):
+        self.target_column = target_column
+        return self
+
+    def explain(self):
+        lines = [f"source: {type(self.source).__name__} (chunksize={self.chunksize})"]
+        lines += [f"  -> {step}" for step in self.steps]
+        if self.target_column is not None:
+            lines.append(f"  -> split target {self.target_column!r}")
+        return "\n".join(lines)
+
+    def __repr__(self):
+        return f"LazyPipeline(\n{self.explain()}\n)"
+
+    # ---- execution --------------------------------------------------------
+
+    def iter_batches(self):
+        if "optimize_dtypes" in self.steps and not self.optimizer.is_fitted:
+            self.optimizer.fit(self._chunks())
+        if "handle_missing_values" in self.steps and not self.cleaner.is_fitted:
+            self._fit_cleaner()
+
+        for chunk in self._chunks():
+            columns = self._run(chunk, self.steps)
+            if self.target_column is None:
+                yield pd.DataFrame(columns, copy=False)
+            else:
+                y = pd.Series(columns.pop(self.target_column), name=self.target_column)
+                yield pd.DataFrame(columns, copy=False), y
+
+    def collect(self):
+        batches = list(self.iter_batches())
+        categories = getattr(self.source, "categories", None)
+        if categories is not None:
+            # Batches encoded before the dictionary grew get its final
+            # categories, so concat keeps them categorical.
+            batches = [
+                categories.align(b) if self.target_column is None else (categories.align(b[0]), b[1])
+                for b in batches
+            ]
+        if self.target_column is None:
+            return pd.concat(batches, ignore_index=True)
+        X = pd.concat([X for X, _ in batches], ignore_index=True)
+        y = pd.concat([y for _, y in batches], ignore_index=True)
+        return X, y
+
+    def _chunks(self):
+        if isinstance(self.source, pd.DataFrame):
+            for start in range(0, len(self.source), self.chunksize):
+                yield self.source.iloc[start:start + self.chunksize]
+        elif isinstance(self.source, DataLoader):
+            yield from self.source.iter_chunks(self.chunksize)
+        else:
+            raise TypeError("LazyPipeline source must be a DataFrame or a DataLoader")
+
+    def _fit_cleaner(self):
+        # The statistics must be learnt on the data as the fill step sees
+        # it, i.e. after any steps planned before it.
+        before = self.steps[:self.steps.index("handle_missing_values")]
+        for chunk in self._chunks():
+            self.cleaner.partial_fit(pd.DataFrame(self._run(chunk, before), copy=False))
+
+    def _run(self, chunk, steps):
+        if "optimize_dtypes" in steps:
+            chunk = self.optimizer.transform(chunk)
+        columns = {col: _column_values(chunk[col]) for col in chunk.columns}
+
+        for step in steps:
+            if step == "handle_missing_values":
+                fills = self.cleaner.fill_values_
+                for col, values in columns.items():
+                    if col in fills and values.dtype.kind == "f":
+                        missing = np.isnan(values)
+                        if missing.any():
+                            columns[col] = np.where(missing, fills[col], values)
+            elif step == "remove_invalid_rows":
+                mask = self.cleaner.valid_mask(columns)
+                if not mask.all():
+                    columns = {col: values[mask] for col, values in columns.items()}
+            elif step == "create_features":
+                columns.update(FeatureEngineer.compute_features(columns, self.features))
+
+        return columns
+
+
+def _column_values(series):
+    if isinstance(series.dtype, np.dtype):
+        return series.to_numpy()
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # Keep the codes + dictionary; to_numpy() would expand to objects.
+        return series.array
+    if getattr(series.dtype, "kind", "O") in "iuf":
+        # Nullable Int64/Float64: NaN-backed floats so missing values fill
+        # like everything else.
+        return series.to_numpy(dtype=np.float64, na_value=np.nan)
+    return series.to_numpy()
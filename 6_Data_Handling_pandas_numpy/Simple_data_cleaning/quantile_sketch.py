@@ -0,0 +1,104 @@
+import numpy as np
+
+
+class QuantileSketch:
+    # Streaming, mergeable quantile estimator.
+    #
+    # Values are kept verbatim until `exact_limit` of them have been seen, so
+    # small inputs get exact answers. Past that the sketch switches to a list
+    # of (centroid, weight) pairs compressed to at most `capacity` bins of
+    # roughly equal weight; the rank error of a quantile is then about
+    # 1 / capacity. Two sketches merge by pooling their centroids, so shards
+    # can be summarised independently and combined afterwards.
+
+    def __init__(self, exact_limit=1_000_000, capacity=2_000):
+        self.exact_limit = exact_limit
+        self.capacity = capacity
+        self.count = 0
+        self._values = []
+        self._centroids = None
+        self._weights = None
+
+    @property
+    def is_exact(self):
+        return self._centroids is None
+
+    def update(self, values):
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return self
+
+        self.count += values.size
+        if self.is_exact:
+            self._values.append(values)
+            if self.count > self.exact_limit:
+                self._to_centroids()
+        else:
+            self._absorb(values, np.ones(values.size))
+        return self
+
+    def merge(self, other):
+        self.count += other.count
+        if self.is_exact and other.is_exact:
+            self._values.extend(other._values)
+            if self.count > self.exact_limit:
+                self._to_centroids()
+            return self
+
+        if self.is_exact:
+            self._to_centroids()
+        centroids, weights = other._as_centroids()
+        self._absorb(centroids, weights)
+        return self
+
+    def quantile(self, q):
+        if self.count == 0:
+            return np.nan
+        if self.is_exact:
+            return float(np.quantile(np.concatenate(self._values), q))
+
+        # Interpolate between centroid midpoints on the cumulative weight.
+        cum = np.cumsum(self._weights) - self._weights / 2
+        return float(np.interp(q * self.count, cum, self._centroids))
+
+    def median(self):
+        return self.quantile(0.5)
+
+    def _as_centroids(self):
+        if self.is_exact:
+            if not self._values:
+                return np.empty(0), np.empty(0)
+            values = np.concatenate(self._values)
+            return values, np.ones(values.size)
+        return self._centroids, self._weights
+
+    def _to_centroids(self):
+        centroids, weights = self._as_centroids()
+        self._values = []
+        self._centroids = np.empty(0)
+        self._weights = np.empty(0)
+        self._absorb(centroids, weights)
+
+    def _absorb(self, centroids, weights):
+        centroids = np.concatenate([self._centroids, centroids])
+        weights = np.concatenate([self._weights, weights])
+        order = np.argsort(centroids, kind="stable")
+        centroids, weights = centroids[order], weights[order]
+
+        if centroids.size > self.capacity:
+            # Assign every point to one of `capacity` equal-weight bins and
+            # replace each bin by its weighted mean.
+            cum = np.cumsum(weights)
+            bins = np.minimum(
+                ((cum - weights / 2) / cum[-1] * self.capacity).astype(np.int64),
+                self.capacity - 1,
+            )
+            bin_weights = np.bincount(bins, weights=weights, minlength=self.capacity)
+            bin_sums = np.bincount(bins, weights=centroids * weights, minlength=self.capacity)
+            keep = bin_weights > 0
+            centroids = bin_sums[keep] / bin_weights[keep]
+            weights = bin_weights[keep]
+
+        self._centroids = centroids
+        self._weights = weights
@@ -1,6 +1,8 @@
 # Day 02 - Functions
 # Author: Rakshith
 
+import numpy as np
+
 def add(a, b):
     """
     Adds two numbers.
@@ -21,19 +23,116 @@ def calculate_average(numbers):
     """
     if len(numbers) == 0:
         return 0
-    return sum(numbers) / len(numbers)
+    return RunningStats().update(numbers).mean
 
 
 def normalize_scores(scores):
     """
     Normalize scores between 0 and 1.
+
+    If all scores are equal, every score normalizes to 0.
+    """
+    stats = RunningStats().update(scores)
+    return stats.normalize(scores).tolist()
+
+
+class RunningStats:
     """
-    min_score = min(scores)
-    max_score = max(scores)
+    Single-pass count, mean, variance, min and max.
+
+    Values can be added chunk by chunk with update(), and statistics kept
+    on different shards or processes can be combined with merge(); the
+    result is the same as if all values had been seen at once. Each chunk
+    is summarised with NumPy and folded in with the parallel form of
+    Welford's algorithm (Chan et al.), which stays numerically stable.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0  # sum of squared deviations from the mean
+        self.min = np.inf
+        self.max = -np.inf
+
+    def update(self, values):
+        """
+        Adds a chunk of values.
+
+        Parameters:
+            values (list or numpy array): numbers to add
+
+        Returns:
+            RunningStats: self, so calls can be chained
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if values.size == 0:
+            return self
+        chunk_mean = values.mean()
+        chunk = RunningStats()
+        chunk.count = values.size
+        chunk.mean = float(chunk_mean)
+        deviations = values - chunk_mean
+        chunk.m2 = float(np.dot(deviations, deviations))
+        chunk.min = float(values.min())
+        chunk.max = float(values.max())
+        return self.merge(chunk)
+
+    def merge(self, other):
+        """
+        Combines the statistics of another RunningStats into this one.
+
+        Parameters:
+            other (RunningStats): statistics of another chunk or shard
+
+        Returns:
+            RunningStats: self
+        """
+        if other.count == 0:
+            return self
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.count = total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def variance(self, ddof=0):
+        """
+        Returns the variance (ddof=1 for the sample variance).
+        """
+        if self.count - ddof <= 0:
+            return 0.0
+        return self.m2 / (self.count - ddof)
+
+    def std(self, ddof=0):
+        """
+        Returns the standard deviation (ddof=1 for the sample version).
+        """
+        return self.variance(ddof) ** 0.5
+
+    def normalize(self, values):
+        """
+        Min-max scales values to [0, 1] using the accumulated min and max.
+
+        Returns zeros when all values seen so far are equal.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        span = self.max - self.min
+        if span == 0:
+            return np.zeros_like(values)
+        return (values - self.min) / span
 
-    normalized = []
-    for s in scores:
-        norm = (s - min_score) / (max_score - min_score)
-        normalized.append(norm)
+    def standardize(self, values, ddof=0):
+        """
+        Scales values to zero mean and unit variance using the accumulated
+        mean and standard deviation.
 
-    return normalized
+        Returns zeros when the standard deviation is 0.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        std = self.std(ddof)
+        if std == 0:
+            return np.zeros_like(values)
+        return (values - self.mean) / std